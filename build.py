@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Build script for a standalone Notched Music executable.
+This script bundles the application into a single file with PyInstaller.
+"""
+
+import importlib.util
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+BUILD_DIR = PROJECT_ROOT / "build"
+
+# PyInstaller needs a script as its entry point; src/main.py uses relative
+# imports, so the bundle starts from a launcher that imports the package
+LAUNCHER_SOURCE = '''\
+from src.main import main
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def write_launcher():
+    """Write the entry script that PyInstaller analyses."""
+    BUILD_DIR.mkdir(exist_ok=True)
+    launcher = BUILD_DIR / "notched_music.py"
+    launcher.write_text(LAUNCHER_SOURCE, encoding="utf-8")
+    return launcher
+
+
+def build_executable():
+    """Run PyInstaller to produce dist/NotchedMusic(.exe)."""
+    launcher = write_launcher()
+    command = [
+        sys.executable, "-m", "PyInstaller",
+        "--onefile",
+        "--windowed",
+        "--noconfirm",
+        "--name", "NotchedMusic",
+        "--icon", str(PROJECT_ROOT / "icon.ico"),
+        "--paths", str(PROJECT_ROOT),
+        "--workpath", str(BUILD_DIR / "pyinstaller"),
+        "--specpath", str(BUILD_DIR),
+        # librosa resolves its submodules through lazy_loader stub files
+        "--collect-data", "librosa",
+        str(launcher),
+    ]
+    print(f"Command: {shlex.join(command)}")
+    return subprocess.run(command, cwd=PROJECT_ROOT).returncode == 0
+
+
+def main():
+    """Main build function."""
+    print("Notched Music - Standalone Build")
+    print("=" * 60)
+    
+    if importlib.util.find_spec("PyInstaller") is None:
+        print("ERROR: PyInstaller is not installed. Please install it with:")
+        print("pip install pyinstaller")
+        return 1
+    
+    if not build_executable():
+        print("ERROR: PyInstaller build failed")
+        return 1
+    
+    print(f"\nExecutable created in: {PROJECT_ROOT / 'dist'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,111 @@
 """
 Simple demo file creation without external dependencies.
 Creates basic WAV files using only Python standard library.
+NumPy is used to speed up sample generation when it is installed.
 """
 
 import wave
-import struct
+import array
 import math
 import os
-import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+from demo_utils import AUDIO_EXTENSIONS, link_or_copy
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _tone_period(frequency, sample_rate):
+    """Return the exact period of a tone in samples, or None if it is not periodic.
+    
+    An integer frequency at an integer sample rate repeats every
+    sample_rate / gcd(sample_rate, frequency) samples.
+    """
+    if frequency > 0 and float(frequency).is_integer() and float(sample_rate).is_integer():
+        return int(sample_rate) // math.gcd(int(sample_rate), int(frequency))
+    return None
+
+
+def _fill_tone(out, frequency, sample_rate, amplitude):
+    """Fill a 16-bit sample buffer with a tone using in-place NumPy operations."""
+    period = _tone_period(frequency, sample_rate)
+    if period is not None and period < out.shape[0]:
+        # Compute a single period and repeat it across the buffer
+        table = np.empty(period, dtype=out.dtype)
+        _fill_tone(table, frequency, sample_rate, amplitude)
+        out[:] = np.resize(table, out.shape[0])
+        return
+    
+    phase = np.arange(out.shape[0], dtype=np.float64)
+    phase *= 2 * np.pi * frequency / sample_rate
+    np.sin(phase, out=phase)
+    phase *= amplitude * 32767.0
+    out[:] = phase  # Truncating cast to int16, like int() in the fallback loop
+
+
+def _tone_samples(frequency, num_samples, sample_rate, amplitude):
+    """Generate 16-bit tone samples without NumPy using a recursive oscillator.
+    
+    A sinusoid satisfies s[i+1] = 2*cos(w)*s[i] - s[i-1], so each sample costs
+    one multiply and one subtract instead of a call to math.sin.
+    """
+    period = _tone_period(frequency, sample_rate)
+    if period is not None and period < num_samples:
+        # Compute a single period and repeat it
+        samples = _tone_samples(frequency, period, sample_rate, amplitude)
+        samples *= num_samples // period + 1
+        del samples[num_samples:]
+        return samples
+    
+    w = 2 * math.pi * frequency / sample_rate
+    coeff = 2 * math.cos(w)
+    scale = amplitude * 32767
+    previous = -scale * math.sin(w)  # s[-1]
+    current = 0.0  # s[0]
+    
+    samples = array.array('h')
+    # Bind loop invariants to locals so the loop body avoids global and
+    # attribute lookups
+    append = samples.append
+    to_int = int
+    for _ in range(num_samples):
+        append(to_int(current))  # Convert to 16-bit integer
+        previous, current = current, coeff * current - previous
+    return samples
+
+
+def _frames_bytes(samples):
+    """Return 16-bit samples as little-endian WAV frame bytes."""
+    if sys.byteorder == 'big':
+        samples = array.array('h', samples)
+        samples.byteswap()
+    return samples.tobytes()
+
 
 def create_tone_wav(filename, frequency, duration, sample_rate=44100, amplitude=0.5):
     """Create a WAV file with a pure tone."""
     num_samples = int(sample_rate * duration)
     
+    if NUMPY_AVAILABLE:
+        # Vectorized generation, written with a single writeframes call
+        samples = np.empty(num_samples, dtype='<i2')
+        _fill_tone(samples, frequency, sample_rate, amplitude)
+        with wave.open(str(filename), 'w') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 2 bytes per sample (16-bit)
+            wav_file.setframerate(sample_rate)
+            wav_file.setnframes(num_samples)
+            wav_file.writeframes(samples.tobytes())
+        return
+    
     # Generate audio data
-    audio_data = []
-    for i in range(num_samples):
-        sample = amplitude * math.sin(2 * math.pi * frequency * i / sample_rate)
-        audio_data.append(int(sample * 32767))  # Convert to 16-bit integer
+    audio_data = _tone_samples(frequency, num_samples, sample_rate, amplitude)
     
     # Create WAV file
     with wave.open(str(filename), 'w') as wav_file:
@@ -29,20 +115,30 @@ def create_tone_wav(filename, frequency, duration, sample_rate=44100, amplitude=
         wav_file.setnframes(num_samples)
         
         # Write audio data
-        for sample in audio_data:
-            wav_file.writeframes(struct.pack('<h', sample))
+        wav_file.writeframes(_frames_bytes(audio_data))
 
 
 def create_stereo_tone_wav(filename, left_freq, right_freq, duration, sample_rate=44100, amplitude=0.5):
     """Create a stereo WAV file with different frequencies in each channel."""
     num_samples = int(sample_rate * duration)
     
+    if NUMPY_AVAILABLE:
+        # Row-major (num_samples, 2) array matches WAV's interleaved layout
+        samples = np.empty((num_samples, 2), dtype='<i2')
+        _fill_tone(samples[:, 0], left_freq, sample_rate, amplitude)
+        _fill_tone(samples[:, 1], right_freq, sample_rate, amplitude)
+        with wave.open(str(filename), 'w') as wav_file:
+            wav_file.setnchannels(2)  # Stereo
+            wav_file.setsampwidth(2)  # 2 bytes per sample (16-bit)
+            wav_file.setframerate(sample_rate)
+            wav_file.setnframes(num_samples)
+            wav_file.writeframes(samples.tobytes())
+        return
+    
     # Generate audio data for both channels
-    audio_data = []
-    for i in range(num_samples):
-        left_sample = amplitude * math.sin(2 * math.pi * left_freq * i / sample_rate)
-        right_sample = amplitude * math.sin(2 * math.pi * right_freq * i / sample_rate)
-        audio_data.append((int(left_sample * 32767), int(right_sample * 32767)))
+    audio_data = array.array('h', [0]) * (2 * num_samples)
+    audio_data[0::2] = _tone_samples(left_freq, num_samples, sample_rate, amplitude)
+    audio_data[1::2] = _tone_samples(right_freq, num_samples, sample_rate, amplitude)
     
     # Create WAV file
     with wave.open(str(filename), 'w') as wav_file:
@@ -52,8 +148,13 @@ def create_stereo_tone_wav(filename, left_freq, right_freq, duration, sample_rat
         wav_file.setnframes(num_samples)
         
         # Write audio data (interleaved stereo)
-        for left_sample, right_sample in audio_data:
-            wav_file.writeframes(struct.pack('<hh', left_sample, right_sample))
+        wav_file.writeframes(_frames_bytes(audio_data))
+
+
+def _create_demo_file(job):
+    """Create a single demo file (runs in a worker thread or process)."""
+    create_wav, args = job
+    create_wav(*args)
 
 
 def create_demo_files():
@@ -63,49 +164,52 @@ def create_demo_files():
     
     print("Creating simple demo audio files...")
     
-    # 1. 440 Hz tone (A4 note)
-    print("Creating 440 Hz tone...")
-    create_tone_wav(demo_dir / "440hz_tone.wav", 440, 3.0)
-    
-    # 2. 1000 Hz tone (for notch filtering)
-    print("Creating 1000 Hz tone...")
-    create_tone_wav(demo_dir / "1000hz_tone.wav", 1000, 3.0)
-    
-    # 3. 2000 Hz tone
-    print("Creating 2000 Hz tone...")
-    create_tone_wav(demo_dir / "2000hz_tone.wav", 2000, 3.0)
-    
-    # 4. Stereo file with different frequencies
-    print("Creating stereo file...")
-    create_stereo_tone_wav(demo_dir / "stereo_test.wav", 440, 880, 3.0)
-    
-    # 5. Short test file
-    print("Creating short test file...")
-    create_tone_wav(demo_dir / "short_test.wav", 1000, 0.5)
+    # (description, writer, args) for each independent demo file
+    demo_specs = [
+        # 1. 440 Hz tone (A4 note)
+        ("440 Hz tone", create_tone_wav, (demo_dir / "440hz_tone.wav", 440, 3.0)),
+        # 2. 1000 Hz tone (for notch filtering)
+        ("1000 Hz tone", create_tone_wav, (demo_dir / "1000hz_tone.wav", 1000, 3.0)),
+        # 3. 2000 Hz tone
+        ("2000 Hz tone", create_tone_wav, (demo_dir / "2000hz_tone.wav", 2000, 3.0)),
+        # 4. Stereo file with different frequencies
+        ("stereo file", create_stereo_tone_wav, (demo_dir / "stereo_test.wav", 440, 880, 3.0)),
+        # 5. Short test file
+        ("short test file", create_tone_wav, (demo_dir / "short_test.wav", 1000, 0.5)),
+        # 6. Low frequency tone
+        ("low frequency tone", create_tone_wav, (demo_dir / "low_freq_tone.wav", 100, 2.0)),
+        # 7. High frequency tone
+        ("high frequency tone", create_tone_wav, (demo_dir / "high_freq_tone.wav", 8000, 2.0)),
+    ]
     
-    # 6. Low frequency tone
-    print("Creating low frequency tone...")
-    create_tone_wav(demo_dir / "low_freq_tone.wav", 100, 2.0)
+    jobs = []
+    for description, create_wav, args in demo_specs:
+        print(f"Creating {description}...")
+        jobs.append((create_wav, args))
     
-    # 7. High frequency tone
-    print("Creating high frequency tone...")
-    create_tone_wav(demo_dir / "high_freq_tone.wav", 8000, 2.0)
+    # Files are independent, so generate them in parallel. The NumPy path
+    # spends its time in ufuncs that release the GIL, so threads suffice;
+    # the pure-Python fallback holds the GIL and needs separate processes.
+    executor_class = ThreadPoolExecutor if NUMPY_AVAILABLE else ProcessPoolExecutor
+    with executor_class(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_create_demo_file, jobs))
     
     # Create additional formats for testing
     print("\nCreating additional formats...")
     wav_files = list(demo_dir.glob("*.wav"))
     
-    # Create MP3 versions of some files (demo purposes - just copy with different extension)
+    # Create MP3 versions of some files (demo purposes - just link with different extension)
     for i, wav_file in enumerate(wav_files[:3]):  # Convert first 3 files
         mp3_file = demo_dir / f"{wav_file.stem}.mp3"
-        shutil.copy2(wav_file, mp3_file)
+        link_or_copy(wav_file, mp3_file)
         print(f"Created {mp3_file.name} (demo format)")
     
     print(f"\nDemo files created in: {demo_dir}")
     print("Files created:")
-    for file in demo_dir.glob("*"):
-        if file.suffix.lower() in ['.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a']:
-            print(f"  - {file.name}")
+    with os.scandir(demo_dir) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                print(f"  - {entry.name}")
 
 
 if __name__ == "__main__":
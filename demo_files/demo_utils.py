@@ -0,0 +1,24 @@
+"""
+File helpers shared by the demo scripts.
+Uses only the Python standard library.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+# Mirrors AudioProcessor.SUPPORTED_FORMATS; not imported from src so the
+# demo scripts keep running without the application's dependencies
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a'})
+
+
+def link_or_copy(source, destination):
+    """Hardlink source to destination, falling back to a full copy."""
+    destination = Path(destination)
+    if destination.exists():
+        destination.unlink()
+    try:
+        os.link(source, destination)
+    except (OSError, NotImplementedError):
+        # Hardlinks are unsupported on some filesystems and across devices
+        shutil.copy2(source, destination)
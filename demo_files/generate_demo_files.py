@@ -2,42 +2,136 @@
 Script to generate demo audio files for testing the Notched Music application.
 """
 
-import numpy as np
-import soundfile as sf
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from demo_utils import AUDIO_EXTENSIONS, link_or_copy
+
+# Samples generated and written per block when streaming demo files to disk
+BLOCK_SIZE = 16384
+
+
+def _phase(frequency, start, num_samples, sample_rate):
+    """Return the phase 2*pi*f*n/sr for sample indices start .. start+num_samples-1.
+    
+    The phase stays float64 for accuracy over long durations; the signals
+    built from it are float32.
+    """
+    import numpy as np
+    
+    phase = np.arange(start, start + num_samples, dtype=np.float64)
+    phase *= 2 * np.pi * frequency / sample_rate
+    return phase
+
+
+def tone_block(start, num_samples, frequency, sample_rate=44100, amplitude=0.5):
+    """Generate a block of a pure tone starting at sample index start."""
+    import numpy as np
+    
+    tone = np.empty(num_samples, dtype=np.float32)
+    np.sin(_phase(frequency, start, num_samples, sample_rate), out=tone)
+    tone *= np.float32(amplitude)
+    return tone
+
+
+def chord_block(start, num_samples, frequencies, sample_rate=44100, amplitude=0.3):
+    """Generate a block of a chord starting at sample index start."""
+    import numpy as np
+    
+    n = np.arange(start, start + num_samples, dtype=np.float64)
+    # One (K, N) sine evaluation reduced over the frequency axis
+    freqs = np.asarray(frequencies, dtype=np.float64)
+    phases = (2 * np.pi * freqs / sample_rate)[:, None] * n[None, :]
+    partials = np.empty(phases.shape, dtype=np.float32)
+    np.sin(phases, out=partials)
+    chord = partials.sum(axis=0)
+    chord *= np.float32(amplitude)
+    return chord
+
+
+def noise_with_tone_block(start, num_samples, noise_freq, sample_rate=44100,
+                          noise_level=0.1, rng=None):
+    """Generate a block of noise with a specific frequency component.
+    
+    Pass the same rng for every block of a signal so the noise continues
+    rather than repeating.
+    """
+    import numpy as np
+    
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Generate white noise directly into the output buffer
+    signal = np.empty(num_samples, dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=signal)
+    signal *= np.float32(noise_level)
+    
+    # Add specific frequency component in place
+    signal += tone_block(start, num_samples, noise_freq, sample_rate, 0.5)
+    
+    return signal
+
+
+def stereo_tone_block(start, num_samples, left_freq, right_freq, sample_rate=44100):
+    """Generate a block of a stereo signal with a different tone in each channel."""
+    import numpy as np
+    
+    stereo = np.empty((num_samples, 2), dtype=np.float32)
+    stereo[:, 0] = tone_block(start, num_samples, left_freq, sample_rate)
+    stereo[:, 1] = tone_block(start, num_samples, right_freq, sample_rate)
+    return stereo
+
+
+def complex_signal_block(start, num_samples, sample_rate=44100):
+    """Generate a block of a signal with multiple frequencies including 1000 Hz."""
+    signal = tone_block(start, num_samples, 200, sample_rate, 0.3)
+    for frequency, amplitude in ((500, 0.3), (1000, 0.4), (2000, 0.3), (4000, 0.2)):
+        signal += tone_block(start, num_samples, frequency, sample_rate, amplitude)
+    return signal
+
 
 def generate_tone(frequency, duration, sample_rate=44100, amplitude=0.5):
     """Generate a pure tone."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    return amplitude * np.sin(2 * np.pi * frequency * t)
+    return tone_block(0, int(sample_rate * duration), frequency, sample_rate, amplitude)
 
 
 def generate_chord(frequencies, duration, sample_rate=44100, amplitude=0.3):
     """Generate a chord from multiple frequencies."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    signal = np.zeros_like(t)
-    for freq in frequencies:
-        signal += amplitude * np.sin(2 * np.pi * freq * t)
-    return signal
+    return chord_block(0, int(sample_rate * duration), frequencies, sample_rate, amplitude)
 
 
 def generate_noise_with_tone(noise_freq, duration, sample_rate=44100, noise_level=0.1):
     """Generate noise with a specific frequency component."""
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    
-    # Generate white noise
-    noise = np.random.normal(0, noise_level, len(t))
-    
-    # Add specific frequency component
-    tone = 0.5 * np.sin(2 * np.pi * noise_freq * t)
+    return noise_with_tone_block(0, int(sample_rate * duration), noise_freq,
+                                 sample_rate, noise_level)
+
+
+def generate_stereo_tone(left_freq, right_freq, duration, sample_rate=44100):
+    """Generate a stereo signal with a different tone in each channel."""
+    return stereo_tone_block(0, int(sample_rate * duration), left_freq, right_freq, sample_rate)
+
+
+def generate_complex_signal(duration, sample_rate=44100):
+    """Generate a signal with multiple frequencies including 1000 Hz."""
+    return complex_signal_block(0, int(sample_rate * duration), sample_rate)
+
+
+def _write_demo_file(job):
+    """Generate and write a single demo file block by block (runs in a worker thread)."""
+    import soundfile as sf
     
-    return noise + tone
+    path, block_generator, args, num_samples, channels, sample_rate = job
+    with sf.SoundFile(path, 'w', sample_rate, channels, 'PCM_16') as wav_file:
+        for start in range(0, num_samples, BLOCK_SIZE):
+            block_length = min(BLOCK_SIZE, num_samples - start)
+            wav_file.write(block_generator(start, block_length, *args))
 
 
 def create_demo_files():
     """Create demo audio files for testing."""
+    import numpy as np
+    
     demo_dir = Path(__file__).parent
     demo_dir.mkdir(exist_ok=True)
     
@@ -45,51 +139,41 @@ def create_demo_files():
     
     print("Generating demo audio files...")
     
-    # 1. Simple 440 Hz tone (A4 note)
-    print("Creating 440 Hz tone...")
-    tone_440 = generate_tone(440, 3.0, sample_rate)
-    sf.write(demo_dir / "440hz_tone.wav", tone_440, sample_rate)
-    
-    # 2. Simple 1000 Hz tone (for notch filtering)
-    print("Creating 1000 Hz tone...")
-    tone_1000 = generate_tone(1000, 3.0, sample_rate)
-    sf.write(demo_dir / "1000hz_tone.wav", tone_1000, sample_rate)
-    
-    # 3. Chord with multiple frequencies
-    print("Creating chord...")
-    chord = generate_chord([440, 554, 659, 880], 4.0, sample_rate)  # A major chord
-    sf.write(demo_dir / "a_major_chord.wav", chord, sample_rate)
-    
-    # 4. Noise with 1000 Hz component (perfect for notch filtering demo)
-    print("Creating noise with 1000 Hz component...")
-    noisy_signal = generate_noise_with_tone(1000, 5.0, sample_rate, noise_level=0.2)
-    sf.write(demo_dir / "noise_with_1000hz.wav", noisy_signal, sample_rate)
-    
-    # 5. Stereo file with different frequencies in each channel
-    print("Creating stereo file...")
-    left_channel = generate_tone(440, 3.0, sample_rate)  # A4
-    right_channel = generate_tone(880, 3.0, sample_rate)  # A5
-    stereo_signal = np.array([left_channel, right_channel])
-    sf.write(demo_dir / "stereo_test.wav", stereo_signal.T, sample_rate)
-    
-    # 6. Complex signal with multiple frequencies including 1000 Hz
-    print("Creating complex signal...")
-    complex_signal = (generate_tone(200, 3.0, sample_rate, 0.3) +
-                     generate_tone(500, 3.0, sample_rate, 0.3) +
-                     generate_tone(1000, 3.0, sample_rate, 0.4) +
-                     generate_tone(2000, 3.0, sample_rate, 0.3) +
-                     generate_tone(4000, 3.0, sample_rate, 0.2))
-    sf.write(demo_dir / "complex_signal.wav", complex_signal, sample_rate)
-    
-    # 7. Short test file for quick testing
-    print("Creating short test file...")
-    short_signal = generate_tone(1000, 0.5, sample_rate)
-    sf.write(demo_dir / "short_test.wav", short_signal, sample_rate)
-    
-    # 8. File with metadata (we'll create a simple WAV and add metadata later)
-    print("Creating file for metadata testing...")
-    metadata_signal = generate_tone(440, 2.0, sample_rate)
-    sf.write(demo_dir / "metadata_test.wav", metadata_signal, sample_rate)
+    # (description, filename, block generator, args, duration, channels)
+    # for each independent demo file
+    demo_specs = [
+        # 1. Simple 440 Hz tone (A4 note)
+        ("440 Hz tone", "440hz_tone.wav", tone_block, (440, sample_rate), 3.0, 1),
+        # 2. Simple 1000 Hz tone (for notch filtering)
+        ("1000 Hz tone", "1000hz_tone.wav", tone_block, (1000, sample_rate), 3.0, 1),
+        # 3. Chord with multiple frequencies (A major chord)
+        ("chord", "a_major_chord.wav", chord_block,
+         ([440, 554, 659, 880], sample_rate), 4.0, 1),
+        # 4. Noise with 1000 Hz component (perfect for notch filtering demo)
+        ("noise with 1000 Hz component", "noise_with_1000hz.wav", noise_with_tone_block,
+         (1000, sample_rate, 0.2, np.random.default_rng()), 5.0, 1),
+        # 5. Stereo file with different frequencies in each channel (A4 / A5)
+        ("stereo file", "stereo_test.wav", stereo_tone_block, (440, 880, sample_rate), 3.0, 2),
+        # 6. Complex signal with multiple frequencies including 1000 Hz
+        ("complex signal", "complex_signal.wav", complex_signal_block, (sample_rate,), 3.0, 1),
+        # 7. Short test file for quick testing
+        ("short test file", "short_test.wav", tone_block, (1000, sample_rate), 0.5, 1),
+        # 8. File with metadata (we'll create a simple WAV and add metadata later)
+        ("file for metadata testing", "metadata_test.wav", tone_block,
+         (440, sample_rate), 2.0, 1),
+    ]
+    
+    jobs = []
+    for description, filename, block_generator, args, duration, channels in demo_specs:
+        print(f"Creating {description}...")
+        jobs.append((demo_dir / filename, block_generator, args,
+                     int(sample_rate * duration), channels, sample_rate))
+    
+    # Files are independent, so generate them in parallel. NumPy ufuncs and
+    # libsndfile writes release the GIL, so threads avoid process start-up
+    # and pickling the generated arrays without serializing the work.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_write_demo_file, jobs))
     
     # Create additional formats for testing (if dependencies are available)
     try:
@@ -104,9 +188,8 @@ def create_demo_files():
                 # Load and save as MP3 (this will create a WAV file with MP3 extension for demo purposes)
                 audio_data, sr = librosa.load(str(wav_file), sr=None)
                 # Note: In a real implementation, you'd use ffmpeg or similar to create actual MP3
-                # For demo purposes, we'll just copy the WAV file with MP3 extension
-                import shutil
-                shutil.copy2(wav_file, mp3_file)
+                # For demo purposes, we'll just link the WAV file with MP3 extension
+                link_or_copy(wav_file, mp3_file)
                 print(f"Created {mp3_file.name} (demo format)")
             except Exception as e:
                 print(f"Could not create {mp3_file.name}: {e}")
@@ -116,9 +199,10 @@ def create_demo_files():
     
     print(f"\nDemo files created in: {demo_dir}")
     print("Files created:")
-    for file in demo_dir.glob("*"):
-        if file.suffix.lower() in ['.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a']:
-            print(f"  - {file.name}")
+    with os.scandir(demo_dir) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS:
+                print(f"  - {entry.name}")
 
 
 if __name__ == "__main__":
@@ -4,30 +4,31 @@ Dependency installation script for Notched Music.
 This script installs all required dependencies for the project.
 """
 
+import importlib.util
 import subprocess
+import shlex
 import sys
 import os
 from pathlib import Path
 
 
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command (an argv list, no shell) and handle errors."""
     print(f"\n{'='*60}")
     print(f"Installing: {description}")
-    print(f"Command: {command}")
+    print(f"Command: {shlex.join(command)}")
     print(f"{'='*60}")
     
-    try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error installing {description}: {e}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+    # Stream output as it arrives instead of buffering pip's whole log
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    
+    if process.returncode != 0:
+        print(f"Error installing {description}: command exited with status {process.returncode}")
         return False
+    return True
 
 
 def check_python_version():
@@ -43,7 +44,7 @@ def check_python_version():
 def upgrade_pip():
     """Upgrade pip to latest version."""
     return run_command(
-        f"{sys.executable} -m pip install --upgrade pip",
+        [sys.executable, "-m", "pip", "install", "--upgrade", "pip"],
         "Upgrading pip"
     )
 
@@ -58,7 +59,7 @@ def install_requirements():
         return False
     
     return run_command(
-        f"{sys.executable} -m pip install -r {requirements_file}",
+        [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)],
         "Core dependencies from requirements.txt"
     )
 
@@ -66,25 +67,25 @@ def install_requirements():
 def install_dev_dependencies():
     """Install development dependencies."""
     dev_deps = [
-        "pytest>=6.2.0",
+        "pytest>=7.0",
         "pytest-cov>=2.12.0",
+        "pytest-benchmark>=3.4.0",
         "black>=21.0.0",
         "flake8>=3.9.0",
         "mypy>=0.910"
     ]
     
-    success = True
-    for dep in dev_deps:
-        if not run_command(f"{sys.executable} -m pip install {dep}", f"Development dependency: {dep}"):
-            success = False
-    
-    return success
+    # One pip invocation resolves all dependencies together
+    return run_command(
+        [sys.executable, "-m", "pip", "install", *dev_deps],
+        f"Development dependencies: {', '.join(dev_deps)}"
+    )
 
 
 def install_package():
     """Install the package in development mode."""
     return run_command(
-        f"{sys.executable} -m pip install -e .",
+        [sys.executable, "-m", "pip", "install", "-e", "."],
         "Notched Music package (development mode)"
     )
 
@@ -108,10 +109,10 @@ def verify_installation():
     
     success = True
     for package in packages_to_check:
-        try:
-            __import__(package)
+        # find_spec locates the package without executing its import
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             print(f"❌ {package} - NOT INSTALLED")
             success = False
     
@@ -156,7 +157,7 @@ def main():
     print("INSTALLATION COMPLETE!")
     print(f"{'='*60}")
     print("You can now run the application with:")
-    print("  python src/main.py")
+    print("  python -m src")
     print("\nOr run tests with:")
     print("  python run_tests.py")
     print("\nOr use pytest directly:")
@@ -11,6 +11,8 @@ from pathlib import Path
 import tempfile
 import shutil
 
+from demo_files.demo_utils import AUDIO_EXTENSIONS, link_or_copy
+
 
 def create_demo_environment():
     """Create a demo environment with sample files."""
@@ -32,15 +34,15 @@ def create_demo_environment():
     # Copy demo files to input directory
     demo_files_dir = Path("demo_files")
     if demo_files_dir.exists():
-        # Supported audio formats from AudioProcessor
-        supported_formats = {'.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a'}
-        
         copied_count = 0
-        for audio_file in demo_files_dir.iterdir():
-            if audio_file.is_file() and audio_file.suffix.lower() in supported_formats:
-                shutil.copy2(audio_file, input_dir)
-                print(f"Copied {audio_file.name} to input directory")
-                copied_count += 1
+        # DirEntry.is_file() reuses the type from the directory listing
+        with os.scandir(demo_files_dir) as entries:
+            for entry in entries:
+                if (os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS
+                        and entry.is_file()):
+                    link_or_copy(entry.path, input_dir / entry.name)
+                    print(f"Copied {entry.name} to input directory")
+                    copied_count += 1
         
         if copied_count == 0:
             print("No supported audio files found in demo_files directory")
@@ -65,8 +67,7 @@ def run_audio_processing_demo():
     
     # Import and use the audio processor
     try:
-        sys.path.insert(0, str(Path("src")))
-        from audio_processor import AudioProcessor
+        from src.audio_processor import AudioProcessor
         
         # Create processor with 1000 Hz notch filter
         processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0)
@@ -117,7 +118,7 @@ def run_gui_demo():
     
     try:
         # Launch GUI
-        subprocess.run([sys.executable, "src/main.py"], check=True)
+        subprocess.run([sys.executable, "-m", "src"], check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error launching GUI: {e}")
@@ -184,7 +185,7 @@ def main():
     print("DEMO COMPLETE!")
     print(f"{'='*60}")
     print("You can now:")
-    print("  - Run the application: python src/main.py")
+    print("  - Run the application: python -m src")
     print("  - Run tests: python run_tests.py")
     print("  - Process your own audio files")
     
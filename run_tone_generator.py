@@ -3,14 +3,8 @@
 Launcher script for the Tinnitus Frequency Identifier
 """
 
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 try:
-    from tone_generator import main
+    from src.tone_generator import main
     print("🎵 Starting Tinnitus Frequency Identifier...")
     print("📻 Vintage Stereo Style - Identify Your Tinnitus Frequency!")
     print()
@@ -61,7 +61,7 @@ if exist venv\Scripts\activate.bat (
 
     REM Verify installation
     echo Verifying installation...
-    python -c "import sys; sys.path.insert(0, 'src'); from audio_processor import AudioProcessor; print('✅ Audio processor imports successfully')" 2>nul
+    python -c "from src.audio_processor import AudioProcessor; print('✅ Audio processor imports successfully')" 2>nul
     if errorlevel 1 (
         echo ⚠️  Some dependencies may not be installed correctly
         echo You can run: python install_dependencies.py
@@ -79,7 +79,7 @@ if exist venv\Scripts\activate.bat (
     echo   call venv\Scripts\activate.bat
     echo.
     echo To run the application:
-    echo   python src\main.py
+    echo   python -m src
     echo.
     echo To run tests:
     echo   python run_tests.py
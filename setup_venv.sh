@@ -59,7 +59,7 @@ if [ -f "venv/bin/activate" ]; then
 
     # Verify installation
     echo "Verifying installation..."
-    if python -c "import sys; sys.path.insert(0, 'src'); from audio_processor import AudioProcessor; print('✅ Audio processor imports successfully')" 2>/dev/null; then
+    if python -c "from src.audio_processor import AudioProcessor; print('✅ Audio processor imports successfully')" 2>/dev/null; then
         echo "✅ Core components verified"
     else
         echo "⚠️  Some dependencies may not be installed correctly"
@@ -76,7 +76,7 @@ if [ -f "venv/bin/activate" ]; then
     echo "  source venv/bin/activate"
     echo ""
     echo "To run the application:"
-    echo "  python src/main.py"
+    echo "  python -m src"
     echo ""
     echo "To run tests:"
     echo "  python run_tests.py"
@@ -0,0 +1,8 @@
+"""
+Run the Notched Music application with ``python -m src``.
+"""
+
+from .main import main
+
+if __name__ == "__main__":
+    main()
@@ -2,27 +2,97 @@
 Audio processing module for applying notch filters to audio files.
 """
 
+import functools
+import io
+import importlib.util
 import os
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import numpy as np
 import librosa
 import soundfile as sf
 from scipy import signal
 from mutagen import File as MutagenFile
-from mutagen.id3 import ID3NoHeaderError
-import eyed3
+from mutagen.id3 import ID3, ID3NoHeaderError, TPE1, TALB, TIT2, TRCK, TCON, TDRC
 import logging
-from typing import Tuple, Optional, List
+import logging.handlers
+from typing import Callable, Tuple, Optional, List
 from pathlib import Path
 
+try:
+    import cupy as cp
+    from cupyx.scipy import signal as cupy_signal
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+# torch is only imported when GPU filtering runs, as importing it is slow
+TORCHAUDIO_AVAILABLE = importlib.util.find_spec("torchaudio") is not None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _design_notch(notch_frequency: float, quality_factor: float,
+                  sample_rate: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Design an IIR notch as (sos, zi), shared by every AudioProcessor.
+    
+    Every caller gets the same arrays, so they are returned read-only.
+    """
+    b, a = signal.iirnotch(notch_frequency, quality_factor, sample_rate)
+    sos = signal.tf2sos(b, a)
+    return _read_only(sos), _read_only(signal.sosfilt_zi(sos))
+
+
+@functools.lru_cache(maxsize=32)
+def _design_cascade(frequencies: Tuple[float, ...], q_factors: Tuple[float, ...],
+                    sample_rate: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Design one notch per frequency, cascaded as (sos, zi), returned read-only."""
+    sos = np.vstack([_design_notch(f, q, sample_rate)[0] for f, q in zip(frequencies, q_factors)])
+    return _read_only(sos), _read_only(signal.sosfilt_zi(sos))
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark a cached array read-only, so modifying it in place fails loudly."""
+    array.flags.writeable = False
+    return array
+
+
 class AudioProcessor:
     """Handles audio file processing including notch filtering and metadata editing."""
     
     SUPPORTED_FORMATS = {'.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a'}
     
-    def __init__(self, notch_frequency: float, quality_factor: float = 30.0, frequency_range: float = None):
+    # mutagen "easy" tag keys copied from the source file and their ID3 frames
+    MP3_TAG_FRAMES = {
+        'artist': TPE1,
+        'album': TALB,
+        'title': TIT2,
+        'tracknumber': TRCK,
+        'genre': TCON,
+        'date': TDRC,
+    }
+    
+    # Buffer size for the file handle used when rewriting tags in place
+    TAG_IO_BUFFER_SIZE = 256 * 1024
+    
+    # Files held between pipeline stages when processing with a single worker
+    PIPELINE_QUEUE_SIZE = 4
+    
+    # Files submitted ahead per worker process when processing in parallel
+    QUEUED_FILES_PER_WORKER = 2
+    
+    # Seconds between checks of the cancel event while worker processes run
+    CANCEL_POLL_INTERVAL = 0.1
+    
+    # Samples per channel filtered at a time, sized so a tile stays in cache
+    FILTER_TILE_SIZE = 65536
+    
+    def __init__(self, notch_frequency: float, quality_factor: float = 30.0, frequency_range: float = None,
+                 zero_phase: bool = True, use_gpu: bool = False):
         """
         Initialize the audio processor.
         
@@ -30,16 +100,31 @@ class AudioProcessor:
             notch_frequency: Center frequency to notch out in Hz
             quality_factor: Quality factor for the notch filter (higher = sharper notch)
             frequency_range: Width of the notch in Hz (if None, uses quality_factor)
+            zero_phase: Filter forwards and backwards so the output has no phase shift
+                (if False, a single forward pass takes half the time but shifts phase
+                near the notch frequency)
+            use_gpu: Filter on a CUDA GPU with CuPy, or torchaudio if CuPy is not
+                installed; worthwhile for long tracks, where the transfer cost
+                is amortized
         """
         self.notch_frequency = notch_frequency
         self.quality_factor = quality_factor
         self.frequency_range = frequency_range
+        self.zero_phase = zero_phase
+        self.use_gpu = use_gpu and (CUPY_AVAILABLE or TORCHAUDIO_AVAILABLE)
+        if use_gpu and not self.use_gpu:
+            logger.warning("GPU filtering requested but neither CuPy nor torchaudio is available, "
+                           "using the CPU")
         self.sample_rate = None
         
     def load_audio(self, file_path: str) -> Tuple[np.ndarray, int]:
         """
         Load audio file and return audio data and sample rate.
         
+        Audio is returned channel-first, (channels, samples) or (samples,) for
+        mono, and C-contiguous so each channel is a unit-stride row. The filter
+        relies on this layout; it is only transposed when the file is written.
+        
         Args:
             file_path: Path to the audio file
             
@@ -47,7 +132,15 @@ class AudioProcessor:
             Tuple of (audio_data, sample_rate)
         """
         try:
-            audio_data, sample_rate = librosa.load(file_path, sr=None, mono=False)
+            try:
+                # Decode directly with libsndfile at the native rate and channel count
+                audio_data, sample_rate = sf.read(file_path, dtype='float32')
+                # soundfile is (samples, channels); the rest of the pipeline is channel-first
+                audio_data = np.ascontiguousarray(audio_data.T)
+            except RuntimeError as e:
+                # Formats libsndfile cannot decode (e.g. AAC/M4A) go through librosa
+                logger.debug(f"soundfile could not decode {file_path} ({e}), falling back to librosa")
+                audio_data, sample_rate = librosa.load(file_path, sr=None, mono=False)
             self.sample_rate = sample_rate
             logger.info(f"Loaded audio file: {file_path}, shape: {audio_data.shape}, sr: {sample_rate}")
             return audio_data, sample_rate
@@ -77,27 +170,15 @@ class AudioProcessor:
                 return audio_data
             
             # Calculate effective quality factor based on frequency range
+            effective_q = self._effective_q()
             if self.frequency_range is not None:
-                # Convert frequency range to quality factor
-                # Q = center_frequency / bandwidth
-                effective_q = self.notch_frequency / self.frequency_range
                 logger.info(f"Using frequency range {self.frequency_range} Hz (Q = {effective_q:.2f})")
             else:
-                effective_q = self.quality_factor
                 logger.info(f"Using quality factor Q = {effective_q}")
             
-            # Design IIR notch filter
-            b, a = signal.iirnotch(self.notch_frequency, effective_q, sample_rate)
-            
-            # Apply filter
-            if audio_data.ndim == 1:
-                # Mono audio
-                filtered_audio = signal.filtfilt(b, a, audio_data)
-            else:
-                # Multi-channel audio
-                filtered_audio = np.zeros_like(audio_data)
-                for channel in range(audio_data.shape[0]):
-                    filtered_audio[channel] = signal.filtfilt(b, a, audio_data[channel])
+            # Design IIR notch filter as second-order sections
+            sos, zi = self._get_notch_coefficients(sample_rate, effective_q)
+            filtered_audio = self._apply_sos(sos, zi, audio_data)
             
             logger.info(f"Applied notch filter at {self.notch_frequency} Hz")
             return filtered_audio
@@ -106,33 +187,387 @@ class AudioProcessor:
             logger.error(f"Error applying notch filter: {e}")
             raise
     
+    def apply_cascade_notch(self, audio_data: np.ndarray, sample_rate: int,
+                            notch_frequencies: List[float]) -> np.ndarray:
+        """
+        Apply a notch at each of several frequencies, e.g. a tone and its harmonics.
+        
+        The notches are cascaded into one set of second-order sections, so the
+        audio is filtered in a single pass (or forward-backward pass) however
+        many notches there are. Each notch uses the processor's quality factor,
+        or a width of frequency_range Hz when that is set; notch_frequency is
+        not used. Frequencies at or above Nyquist are skipped.
+        
+        Args:
+            audio_data: Audio data array
+            sample_rate: Sample rate of the audio
+            notch_frequencies: Center frequencies to notch out in Hz
+            
+        Returns:
+            Filtered audio data
+        """
+        try:
+            nyquist = sample_rate / 2
+            frequencies = tuple(f for f in notch_frequencies if f < nyquist)
+            if len(frequencies) < len(notch_frequencies):
+                logger.warning(f"Skipping notch frequencies at or above {nyquist} Hz")
+            if not frequencies:
+                return audio_data
+            
+            if self.frequency_range is not None:
+                q_factors = tuple(f / self.frequency_range for f in frequencies)
+            else:
+                q_factors = (self.quality_factor,) * len(frequencies)
+            
+            sos, zi = self._get_cascade_coefficients(sample_rate, frequencies, q_factors)
+            filtered_audio = self._apply_sos(sos, zi, audio_data)
+            
+            logger.info(f"Applied notch filters at {', '.join(f'{f} Hz' for f in frequencies)}")
+            return filtered_audio
+            
+        except Exception as e:
+            logger.error(f"Error applying cascaded notch filters: {e}")
+            raise
+    
+    def _apply_sos(self, sos: np.ndarray, zi: np.ndarray, audio_data: np.ndarray) -> np.ndarray:
+        """Filter audio with second-order sections and their zi, as configured."""
+        # Filter in the audio's own precision (librosa loads float32) instead
+        # of upcasting to float64; other dtypes are filtered as float64
+        dtype = audio_data.dtype if audio_data.dtype == np.float32 else np.float64
+        
+        # Apply filter along the sample axis; audio is (channels, samples) or
+        # (samples,), so all channels are filtered in a single call. Audio
+        # from load_audio is already contiguous, making this a no-op there
+        audio_data = np.ascontiguousarray(audio_data, dtype=dtype)
+        # sosfilt needs writable sections, so copy the cached design (a few coefficients)
+        sos = sos.astype(dtype)
+        zi = zi.astype(dtype, copy=False)
+        if self.use_gpu:
+            try:
+                if CUPY_AVAILABLE:
+                    return self._filter_gpu(sos, zi, audio_data)
+                return self._filter_torch(sos, audio_data)
+            except Exception as e:
+                logger.warning(f"GPU filtering failed ({e}), falling back to the CPU")
+        if self.zero_phase:
+            return self._sosfiltfilt(sos, zi, audio_data)
+        return self._sosfilt(sos, zi, audio_data)
+    
+    def apply_notch_filter_streaming(self, audio_data: np.ndarray, sample_rate: int,
+                                     state: Optional[np.ndarray] = None
+                                     ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Apply the forward-only notch filter to one block of a longer signal.
+        
+        Pass consecutive blocks in order, each with the state returned for the
+        previous one, and together they come out the same as a single forward
+        pass over the whole signal. The first block (state=None) starts the
+        filter in steady state for its first sample. There is no backward pass
+        or edge padding, so this does half the work of the zero-phase filter,
+        at the cost of a phase shift near the notch frequency. Audio at a
+        sample rate too low for the notch is returned unchanged.
+        
+        Args:
+            audio_data: Block of audio, (channels, samples) or (samples,)
+            sample_rate: Sample rate of the audio
+            state: Filter state returned with the previous block (None for the first block)
+            
+        Returns:
+            Tuple of (filtered block, state for the next block)
+        """
+        if self.notch_frequency >= sample_rate / 2:
+            return audio_data, state
+        
+        sos, zi = self._get_notch_coefficients(sample_rate, self._effective_q())
+        
+        # Same precision rules as apply_notch_filter
+        dtype = audio_data.dtype if audio_data.dtype == np.float32 else np.float64
+        audio_data = np.ascontiguousarray(audio_data, dtype=dtype)
+        sos = sos.astype(dtype)
+        if state is None:
+            zi = zi.astype(dtype, copy=False)
+            zi = zi.reshape((sos.shape[0],) + (1,) * (audio_data.ndim - 1) + (2,))
+            state = zi * audio_data[..., :1]
+        return signal.sosfilt(sos, audio_data, axis=-1, zi=state)
+    
+    def _effective_q(self) -> float:
+        """Return the notch's quality factor, derived from frequency_range when that is set."""
+        if self.frequency_range is not None:
+            # Q = center_frequency / bandwidth
+            return self.notch_frequency / self.frequency_range
+        return self.quality_factor
+    
+    def _stream_filter(self, input_path: str, output, output_format: str = 'MP3',
+                       blocksize: int = FILTER_TILE_SIZE) -> None:
+        """
+        Decode, notch filter and encode a file one block at a time.
+        
+        Only the forward-only filter can run this way, as the backward pass
+        of a zero-phase filter needs the whole signal. The filter state is
+        carried from block to block, so the output is the same as filtering
+        the whole file, but memory use is bounded by the block size rather
+        than the length of the track.
+        
+        Args:
+            input_path: Path to an audio file libsndfile can decode
+            output: Path or file-like object to encode the filtered audio to
+            output_format: soundfile format of the output
+            blocksize: Frames decoded, filtered and encoded at a time
+        """
+        with sf.SoundFile(input_path) as source:
+            sample_rate = source.samplerate
+            if self.notch_frequency >= sample_rate / 2:
+                logger.warning(f"Notch frequency {self.notch_frequency} Hz is too high for sample rate {sample_rate} Hz")
+            
+            with sf.SoundFile(output, 'w', sample_rate, source.channels,
+                              format=output_format) as target:
+                state = None
+                # Blocks are (frames, channels), the layout the encoder takes;
+                # the filter works on channel-first views of them
+                for block in source.blocks(blocksize=blocksize, dtype='float32', always_2d=True):
+                    filtered, state = self.apply_notch_filter_streaming(block.T, sample_rate, state)
+                    target.write(filtered.T)
+        
+        self.sample_rate = sample_rate
+        logger.info(f"Streamed {input_path} through the notch filter at {self.notch_frequency} Hz")
+    
+    def _get_notch_coefficients(self, sample_rate: int,
+                                effective_q: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the notch filter as read-only (sos, zi), designing it on first use.
+        
+        zi is the steady-state initial condition from sosfilt_zi, computed once
+        per design instead of on every filtfilt call. Designs come from a
+        module-level cache, so processors with the same settings share them.
+        """
+        return _design_notch(self.notch_frequency, effective_q, sample_rate)
+    
+    def _get_cascade_coefficients(self, sample_rate: int, frequencies: Tuple[float, ...],
+                                  q_factors: Tuple[float, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the notch cascade as read-only (sos, zi), designing it on first use."""
+        return _design_cascade(frequencies, q_factors, sample_rate)
+    
+    def _filter_gpu(self, sos: np.ndarray, zi: np.ndarray, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Apply the notch on the GPU with CuPy, returning a NumPy array.
+        
+        All channels are copied to the device and filtered in one call.
+        """
+        sos_gpu = cp.asarray(sos)
+        audio_gpu = cp.asarray(audio_data)
+        if self.zero_phase:
+            filtered_gpu = cupy_signal.sosfiltfilt(sos_gpu, audio_gpu, axis=-1)
+        else:
+            zi_gpu = cp.asarray(zi.reshape((sos.shape[0],) + (1,) * (audio_data.ndim - 1) + (2,)))
+            filtered_gpu, _ = cupy_signal.sosfilt(sos_gpu, audio_gpu, axis=-1,
+                                                  zi=zi_gpu * audio_gpu[..., :1])
+        return cp.asnumpy(filtered_gpu).astype(audio_data.dtype, copy=False)
+    
+    def _filter_torch(self, sos: np.ndarray, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Apply the notch on a CUDA GPU with torchaudio, returning a NumPy array.
+        
+        torchaudio's lfilter takes no initial state, so each section filters
+        its input minus the first sample and adds back that sample times the
+        section's DC gain, which equals starting from the steady state.
+        """
+        import torch
+        import torchaudio.functional as torchaudio_functional
+        
+        if not torch.cuda.is_available():
+            raise RuntimeError("CUDA is not available to torch")
+        
+        if self.zero_phase:
+            edge = self._filtfilt_edge(sos)
+            if audio_data.shape[-1] <= edge:
+                raise ValueError(f"Audio must be longer than {edge} samples to filter")
+            audio_data = self._odd_extend(audio_data, edge)
+        
+        audio_gpu = torch.from_numpy(audio_data).to("cuda")
+        sections = [(torch.tensor(section[:3], dtype=audio_gpu.dtype, device=audio_gpu.device),
+                     torch.tensor(section[3:], dtype=audio_gpu.dtype, device=audio_gpu.device),
+                     float(section[:3].sum() / section[3:].sum()))
+                    for section in sos]
+        
+        def filter_pass(x):
+            for b, a, dc_gain in sections:
+                first = x[..., :1]
+                x = torchaudio_functional.lfilter(x - first, a, b, clamp=False) + first * dc_gain
+            return x
+        
+        filtered_gpu = filter_pass(audio_gpu)
+        if self.zero_phase:
+            filtered_gpu = filter_pass(filtered_gpu.flip(-1)).flip(-1)[..., edge:-edge]
+        return np.ascontiguousarray(filtered_gpu.cpu().numpy())
+    
+    @classmethod
+    def _filter_streaming(cls, sos: np.ndarray, audio_data: np.ndarray, zi: np.ndarray,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Run sosfilt along the last axis one tile at a time.
+        
+        The filter state is carried from tile to tile, so the result equals a
+        single sosfilt call, but each tile's input, output and intermediate
+        section buffers stay cache-resident instead of streaming the whole
+        track through memory for every section.
+        """
+        if out is None:
+            out = np.empty_like(audio_data)
+        num_samples = audio_data.shape[-1]
+        for start in range(0, num_samples, cls.FILTER_TILE_SIZE):
+            stop = min(start + cls.FILTER_TILE_SIZE, num_samples)
+            out[..., start:stop], zi = signal.sosfilt(sos, audio_data[..., start:stop],
+                                                      axis=-1, zi=zi)
+        return out
+    
+    @classmethod
+    def _sosfilt(cls, sos: np.ndarray, zi: np.ndarray, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Single forward pass along the last axis.
+        
+        The filter starts in steady state for the first sample, which avoids
+        the start-up transient of a zero initial state.
+        """
+        zi = zi.reshape((sos.shape[0],) + (1,) * (audio_data.ndim - 1) + (2,))
+        return cls._filter_streaming(sos, audio_data, zi * audio_data[..., :1])
+    
+    @staticmethod
+    def _filtfilt_edge(sos: np.ndarray) -> int:
+        """Return the padding length scipy.signal.sosfiltfilt uses for these sections."""
+        ntaps = 2 * sos.shape[0] + 1 - min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+        return 3 * ntaps
+    
+    @staticmethod
+    def _odd_extend(audio_data: np.ndarray, edge: int) -> np.ndarray:
+        """Extend the last axis by edge samples at each end with odd symmetry."""
+        first = audio_data[..., :1]
+        last = audio_data[..., -1:]
+        return np.concatenate((2 * first - audio_data[..., edge:0:-1],
+                               audio_data,
+                               2 * last - audio_data[..., -2:-(edge + 2):-1]), axis=-1)
+    
+    @classmethod
+    def _sosfiltfilt(cls, sos: np.ndarray, zi: np.ndarray, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Zero-phase filter along the last axis.
+        
+        Matches scipy.signal.sosfiltfilt with its default odd padding, but takes
+        the precomputed zi and keeps the dtype of its inputs throughout.
+        """
+        edge = cls._filtfilt_edge(sos)
+        if audio_data.shape[-1] <= edge:
+            raise ValueError(f"Audio must be longer than {edge} samples to filter")
+        
+        # Odd extension at both ends to suppress edge transients
+        padded = cls._odd_extend(audio_data, edge)
+        
+        # One zi per section, broadcast over every channel
+        zi = zi.reshape((sos.shape[0],) + (1,) * (audio_data.ndim - 1) + (2,))
+        
+        forward = cls._filter_streaming(sos, padded, zi * padded[..., :1])
+        
+        # Run the backward pass over reversed views, writing into a reversed
+        # view of the output so it comes out in forward order
+        backward = np.empty_like(forward)
+        cls._filter_streaming(sos, forward[..., ::-1], zi * forward[..., -1:],
+                              out=backward[..., ::-1])
+        return np.ascontiguousarray(backward[..., edge:-edge])
+    
     def save_audio(self, audio_data: np.ndarray, sample_rate: int, output_path: str, 
-                   original_format: str = 'wav') -> None:
+                   original_format: str = 'wav', tags: Optional[ID3] = None) -> None:
         """
         Save filtered audio data to MP3 file.
         
+        The MP3 is encoded into memory and written to disk once, with the
+        ID3 tag prepended to the encoded frames. The output directory must
+        already exist.
+        
         Args:
             audio_data: Filtered audio data
             sample_rate: Sample rate of the audio
             output_path: Path to save the output file (will be converted to .mp3)
             original_format: Original file format (for logging)
+            tags: ID3 tags to embed in the output (optional)
         """
         try:
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
             # Convert output path to MP3
-            mp3_output_path = str(Path(output_path).with_suffix('.mp3'))
+            mp3_output_path = os.path.splitext(output_path)[0] + '.mp3'
             
-            # Save audio data as MP3
-            sf.write(mp3_output_path, audio_data.T if audio_data.ndim > 1 else audio_data, sample_rate)
+            # Encode audio data as MP3 into an in-memory buffer
+            audio_buffer = io.BytesIO()
+            # soundfile expects (samples, channels); transpose only at this boundary
+            if audio_data.ndim > 1:
+                audio_data = np.ascontiguousarray(audio_data.T)
+            sf.write(audio_buffer, audio_data, sample_rate, format='MP3')
             
-            logger.info(f"Saved filtered audio as MP3 to: {mp3_output_path}")
+            self._write_mp3(mp3_output_path, audio_buffer, tags)
             
         except Exception as e:
             logger.error(f"Error saving audio as MP3: {e}")
             raise
     
+    @staticmethod
+    def _write_mp3(mp3_output_path: str, audio_buffer: io.BytesIO, tags: Optional[ID3]) -> None:
+        """Write encoded MP3 frames to disk, led by their ID3 tag if there is one."""
+        # Serialize the ID3v2 tag on its own; saving into an empty buffer
+        # renders just the tag without parsing or shifting the audio
+        tag_buffer = io.BytesIO()
+        if tags is not None:
+            tags.save(tag_buffer)
+        
+        # The tag leads the file, followed by the encoded frames
+        with open(mp3_output_path, 'wb') as output_file:
+            output_file.write(tag_buffer.getbuffer())
+            output_file.write(audio_buffer.getbuffer())
+        
+        logger.info(f"Saved filtered audio as MP3 to: {mp3_output_path}")
+    
+    def _build_mp3_tags(self, source_path: str, new_artist: Optional[str] = None,
+                        new_album: Optional[str] = None) -> ID3:
+        """
+        Build ID3 tags from the source file's metadata, optionally overriding artist and album.
+        
+        Args:
+            source_path: Path to source audio file
+            new_artist: New artist name (optional)
+            new_album: New album name (optional)
+            
+        Returns:
+            ID3 tags for the output MP3
+        """
+        tags = ID3()
+        
+        try:
+            # easy=True maps ID3, Vorbis and MP4 tags onto common key names
+            source_file = MutagenFile(source_path, easy=True)
+        except Exception as e:
+            logger.debug(f"Could not read metadata from {source_path}: {e}")
+            source_file = None
+        
+        if source_file is not None and source_file.tags:
+            logger.info(f"Found metadata in source file {source_path}")
+            for key, frame in self.MP3_TAG_FRAMES.items():
+                values = source_file.tags.get(key)
+                if values:
+                    tags.add(frame(encoding=3, text=values))
+        else:
+            logger.info(f"No metadata found in source file {source_path}, creating new tags")
+        
+        # Override with new values if specified
+        if new_artist:
+            tags.add(TPE1(encoding=3, text=new_artist))
+            logger.info(f"Set artist to: {new_artist}")
+        else:
+            logger.info("No new artist specified")
+        
+        if new_album:
+            tags.add(TALB(encoding=3, text=new_album))
+            logger.info(f"Set album to: {new_album}")
+        else:
+            logger.info("No new album specified")
+        
+        return tags
+    
     def copy_metadata(self, source_path: str, target_path: str, 
                      new_artist: Optional[str] = None, new_album: Optional[str] = None) -> None:
         """
@@ -159,86 +594,14 @@ class AudioProcessor:
     
     def _copy_mp3_metadata(self, source_path: str, target_path: str, 
                           new_artist: Optional[str] = None, new_album: Optional[str] = None) -> None:
-        """Copy metadata for MP3 files using eyed3."""
+        """Copy metadata for MP3 files using mutagen."""
         try:
-            # Load target file
-            target_mp3 = eyed3.load(target_path)
-            
-            if target_mp3 is None:
-                logger.warning(f"Could not load target file {target_path}")
-                return
-            
-            # Ensure target has tags
-            if target_mp3.tag is None:
-                target_mp3.initTag()
-            
-            # Try to load source metadata, but don't fail if it doesn't exist
-            source_mp3 = eyed3.load(source_path)
-            source_tag = None
-            
-            if source_mp3 is not None and source_mp3.tag is not None:
-                source_tag = source_mp3.tag
-                logger.info(f"Found metadata in source file {source_path}")
-                
-                # Copy basic tags with error handling
-                try:
-                    if hasattr(source_tag, 'artist') and source_tag.artist:
-                        target_mp3.tag.artist = source_tag.artist
-                except Exception as e:
-                    logger.debug(f"Could not copy artist: {e}")
-                
-                try:
-                    if hasattr(source_tag, 'album') and source_tag.album:
-                        target_mp3.tag.album = source_tag.album
-                except Exception as e:
-                    logger.debug(f"Could not copy album: {e}")
-                
-                try:
-                    if hasattr(source_tag, 'title') and source_tag.title:
-                        target_mp3.tag.title = source_tag.title
-                except Exception as e:
-                    logger.debug(f"Could not copy title: {e}")
-                
-                try:
-                    if hasattr(source_tag, 'track_num') and source_tag.track_num:
-                        # Handle track number carefully - it might be a CountAndTotalTuple
-                        if hasattr(source_tag.track_num, 'count'):
-                            # It's a CountAndTotalTuple, extract just the count
-                            target_mp3.tag.track_num = source_tag.track_num.count
-                        else:
-                            target_mp3.tag.track_num = source_tag.track_num
-                except Exception as e:
-                    logger.debug(f"Could not copy track number: {e}")
-                
-                try:
-                    if hasattr(source_tag, 'genre') and source_tag.genre:
-                        target_mp3.tag.genre = source_tag.genre
-                except Exception as e:
-                    logger.debug(f"Could not copy genre: {e}")
-                
-                try:
-                    if hasattr(source_tag, 'year') and source_tag.year:
-                        target_mp3.tag.year = source_tag.year
-                except Exception as e:
-                    logger.debug(f"Could not copy year: {e}")
-            else:
-                logger.info(f"No metadata found in source file {source_path}, creating new tags")
-            
-            # Override with new values if specified
-            if new_artist:
-                target_mp3.tag.artist = new_artist
-                logger.info(f"Set artist to: {new_artist}")
-            else:
-                logger.info("No new artist specified")
-            
-            if new_album:
-                target_mp3.tag.album = new_album
-                logger.info(f"Set album to: {new_album}")
-            else:
-                logger.info("No new album specified")
+            tags = self._build_mp3_tags(source_path, new_artist, new_album)
             
-            # Save the tags
-            target_mp3.tag.save()
+            # mutagen rewrites the file through this handle; the large buffer
+            # coalesces its many small reads and writes into few syscalls
+            with open(target_path, 'r+b', buffering=self.TAG_IO_BUFFER_SIZE) as target_file:
+                tags.save(target_file)
             
         except Exception as e:
             logger.error(f"Error copying MP3 metadata: {e}")
@@ -272,40 +635,24 @@ class AudioProcessor:
             else:
                 logger.info(f"No metadata found in source file {source_path}, creating new tags")
             
-            # Update artist and album if specified
-            if new_artist:
-                try:
-                    # For WAV files, we need to use ID3 tags
-                    if hasattr(target_file, 'tags') and target_file.tags is None:
-                        target_file.add_tags()
-                    
-                    if hasattr(target_file, 'tags') and target_file.tags is not None:
-                        # Use ID3 tags for WAV files
-                        from mutagen.id3 import TPE1
-                        target_file.tags['TPE1'] = TPE1(encoding=3, text=new_artist)
-                    else:
-                        # Fallback for other formats
-                        target_file['artist'] = new_artist
-                    logger.info(f"Set artist to: {new_artist}")
-                except Exception as e:
-                    logger.debug(f"Could not set artist tag: {e}")
+            # Update artist and album if specified, as ID3 frames when the
+            # target carries ID3 tags and plain keys otherwise
+            overrides = [(key, value) for key, value in (('artist', new_artist), ('album', new_album))
+                         if value]
+            if overrides and target_file.tags is None:
+                target_file.add_tags()
+            uses_id3 = isinstance(target_file.tags, ID3)
             
-            if new_album:
+            for key, value in overrides:
                 try:
-                    # For WAV files, we need to use ID3 tags
-                    if hasattr(target_file, 'tags') and target_file.tags is None:
-                        target_file.add_tags()
-                    
-                    if hasattr(target_file, 'tags') and target_file.tags is not None:
-                        # Use ID3 tags for WAV files
-                        from mutagen.id3 import TALB
-                        target_file.tags['TALB'] = TALB(encoding=3, text=new_album)
+                    if uses_id3:
+                        frame = self.MP3_TAG_FRAMES[key](encoding=3, text=value)
+                        target_file.tags[frame.FrameID] = frame
                     else:
-                        # Fallback for other formats
-                        target_file['album'] = new_album
-                    logger.info(f"Set album to: {new_album}")
+                        target_file[key] = value
+                    logger.info(f"Set {key} to: {value}")
                 except Exception as e:
-                    logger.debug(f"Could not set album tag: {e}")
+                    logger.debug(f"Could not set {key} tag: {e}")
             
             # Save metadata
             target_file.save()
@@ -316,7 +663,7 @@ class AudioProcessor:
     def process_file(self, input_path: str, output_path: str, 
                     new_artist: Optional[str] = None, new_album: Optional[str] = None) -> bool:
         """
-        Process a single audio file: load, apply notch filter, save, and copy metadata.
+        Process a single audio file: load, apply notch filter, and save with copied metadata.
         
         Args:
             input_path: Path to input audio file
@@ -334,17 +681,46 @@ class AudioProcessor:
                 logger.warning(f"Unsupported file format: {file_ext}")
                 return False
             
+            # Ensure output directory exists
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+            
+        except Exception as e:
+            logger.error(f"Error processing file {input_path}: {e}")
+            return False
+        
+        return self._process_validated_file(input_path, output_path, new_artist, new_album)
+    
+    def _process_validated_file(self, input_path: str, output_path: str,
+                                new_artist: Optional[str] = None,
+                                new_album: Optional[str] = None) -> bool:
+        """
+        Process a single audio file whose format has been checked and whose
+        output directory exists.
+        """
+        try:
+            # Build the output tags up front so they are written along with the audio
+            tags = self._build_mp3_tags(input_path, new_artist, new_album)
+            
+            if not self.zero_phase and not self.use_gpu:
+                # A forward-only filter streams the file instead of decoding it whole
+                try:
+                    audio_buffer = io.BytesIO()
+                    self._stream_filter(input_path, audio_buffer)
+                    self._write_mp3(os.path.splitext(output_path)[0] + '.mp3', audio_buffer, tags)
+                    return True
+                except RuntimeError as e:
+                    # Formats libsndfile cannot decode are loaded through librosa
+                    logger.debug(f"soundfile could not stream {input_path} ({e}), loading it whole")
+            
             # Load audio
             audio_data, sample_rate = self.load_audio(input_path)
             
             # Apply notch filter
             filtered_audio = self.apply_notch_filter(audio_data, sample_rate)
             
-            # Save filtered audio
-            self.save_audio(filtered_audio, sample_rate, output_path, file_ext)
-            
-            # Copy metadata
-            self.copy_metadata(input_path, output_path, new_artist, new_album)
+            # Save filtered audio with its metadata
+            self.save_audio(filtered_audio, sample_rate, output_path,
+                            os.path.splitext(input_path)[1].lower(), tags)
             
             return True
             
@@ -352,8 +728,56 @@ class AudioProcessor:
             logger.error(f"Error processing file {input_path}: {e}")
             return False
     
+    def _process_file_in_worker(self, input_path: str, output_path: str,
+                                new_artist: Optional[str] = None,
+                                new_album: Optional[str] = None) -> bool:
+        """Log that a worker process is starting on a file, then process it."""
+        logger.info(f"Processing: {input_path}")
+        return self._process_validated_file(input_path, output_path, new_artist, new_album)
+    
+    def _iter_audio_files(self, directory: str):
+        """
+        Yield (path, relative_path) for supported audio files under a directory tree.
+        
+        Uses os.scandir, whose entries carry the file type from the directory
+        read, so no per-entry stat call is needed. Symlinked directories are
+        not followed. Relative paths are built as strings during the walk.
+        """
+        supported_formats = self.SUPPORTED_FORMATS
+        splitext = os.path.splitext
+        pending = [(directory, '')]
+        while pending:
+            current_dir, relative_dir = pending.pop()
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    relative_path = os.path.join(relative_dir, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, relative_path))
+                    elif splitext(entry.name)[1].lower() in supported_formats and entry.is_file():
+                        yield entry.path, relative_path
+    
+    def list_files(self, input_dir: str, output_dir: str) -> List[Tuple[str, str]]:
+        """
+        List the supported audio files under a directory with their output paths.
+        
+        Args:
+            input_dir: Input directory path
+            output_dir: Output directory path
+            
+        Returns:
+            List of (input_path, output_path) pairs, mirroring the input tree
+            under output_dir
+        """
+        # Output paths are joined as strings; Path objects per file add up on
+        # large libraries
+        return [(audio_file, os.path.join(output_dir, relative_path))
+                for audio_file, relative_path in self._iter_audio_files(input_dir)]
+    
     def process_directory(self, input_dir: str, output_dir: str, 
-                         new_artist: Optional[str] = None, new_album: Optional[str] = None) -> List[str]:
+                         new_artist: Optional[str] = None, new_album: Optional[str] = None,
+                         max_workers: Optional[int] = None,
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         cancel_event: Optional[threading.Event] = None) -> List[str]:
         """
         Process all supported audio files in a directory.
         
@@ -362,41 +786,255 @@ class AudioProcessor:
             output_dir: Output directory path
             new_artist: New artist name (optional)
             new_album: New album name (optional)
+            max_workers: Number of worker processes (defaults to the CPU count)
+            progress_callback: Called as progress_callback(completed, total) after
+                each file finishes, successfully or not (optional)
+            cancel_event: When set, files not yet started are skipped; files
+                already being processed are finished (optional)
             
         Returns:
             List of successfully processed files
         """
-        processed_files = []
-        input_path = Path(input_dir)
-        
         # Debug logging
         logger.info(f"Processing directory with new_artist='{new_artist}', new_album='{new_album}'")
         
-        if not input_path.exists():
+        if not Path(input_dir).exists():
             logger.error(f"Input directory does not exist: {input_dir}")
-            return processed_files
+            return []
         
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Find all audio files
-        audio_files = []
-        for ext in self.SUPPORTED_FORMATS:
-            audio_files.extend(input_path.glob(f"**/*{ext}"))
+        # Find all audio files in a single traversal of the tree
+        jobs = self.list_files(input_dir, output_dir)
         
-        logger.info(f"Found {len(audio_files)} audio files to process")
+        logger.info(f"Found {len(jobs)} audio files to process")
         
-        # Process each file
-        for audio_file in audio_files:
-            relative_path = audio_file.relative_to(input_path)
-            output_file = Path(output_dir) / relative_path
+        return self.process_files(jobs, new_artist, new_album, max_workers, progress_callback,
+                                  cancel_event)
+    
+    def process_files(self, jobs: List[Tuple[str, str]],
+                      new_artist: Optional[str] = None, new_album: Optional[str] = None,
+                      max_workers: Optional[int] = None,
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      cancel_event: Optional[threading.Event] = None) -> List[str]:
+        """
+        Process (input_path, output_path) pairs as returned by list_files.
+        
+        Files are processed in parallel worker processes. With max_workers=1 they
+        are processed in this process instead, with decoding and encoding of
+        neighbouring files overlapped with filtering, which is easier to debug.
+        
+        Args:
+            jobs: (input_path, output_path) pairs of supported audio files
+            new_artist: New artist name (optional)
+            new_album: New album name (optional)
+            max_workers: Number of worker processes (defaults to the CPU count)
+            progress_callback: Called as progress_callback(completed, total) after
+                each file finishes, successfully or not (optional)
+            cancel_event: When set, files not yet started are skipped; files
+                already being processed are finished (optional)
             
-            logger.info(f"Processing: {audio_file}")
-            if self.process_file(str(audio_file), str(output_file), new_artist, new_album):
-                processed_files.append(str(audio_file))
-            else:
-                logger.error(f"Failed to process: {audio_file}")
+        Returns:
+            List of successfully processed files
+        """
+        if not jobs:
+            logger.info("Successfully processed 0 files")
+            return []
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(jobs))
         
+        # Create each output subdirectory once up front rather than per file
+        for directory in {os.path.dirname(output_path) for _, output_path in jobs}:
+            os.makedirs(directory, exist_ok=True)
+        
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        
+        progress = _ProgressCounter(len(jobs), progress_callback)
+        if max_workers == 1:
+            processed_files = self._process_files_pipelined(jobs, new_artist, new_album, progress,
+                                                            cancel_event)
+        else:
+            processed_files = self._process_files_parallel(jobs, new_artist, new_album, max_workers,
+                                                           progress, cancel_event)
+        
+        if cancel_event.is_set():
+            logger.info(f"Processing cancelled after {progress.completed} of {len(jobs)} files")
         logger.info(f"Successfully processed {len(processed_files)} files")
         return processed_files
+    
+    def _process_files_parallel(self, jobs: List[Tuple[str, str]], new_artist: Optional[str],
+                                new_album: Optional[str], max_workers: int,
+                                progress: '_ProgressCounter',
+                                cancel_event: threading.Event) -> List[str]:
+        """Process (input_path, output_path) pairs in a pool of worker processes."""
+        processed_files = []
+        
+        # "spawn" avoids inheriting BLAS thread state through fork
+        mp_context = multiprocessing.get_context("spawn")
+        
+        # Spawned workers start without logging configured, so their records are
+        # sent back and handled here, where the GUI and console handlers live
+        log_queue = mp_context.Queue()
+        log_listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger())
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                       initializer=_init_worker_logging,
+                                       initargs=(log_queue, logger.getEffectiveLevel()))
+        
+        # Process each file
+        log_listener.start()
+        try:
+            with executor:
+                pending = {}
+                remaining_jobs = iter(jobs)
+                while True:
+                    # Keep only a few files queued per worker, so cancelling has
+                    # little to unwind and nothing is submitted after it
+                    while (not cancel_event.is_set()
+                           and len(pending) < max_workers * self.QUEUED_FILES_PER_WORKER):
+                        job = next(remaining_jobs, None)
+                        if job is None:
+                            break
+                        input_path, output_path = job
+                        future = executor.submit(self._process_file_in_worker, input_path,
+                                                 output_path, new_artist, new_album)
+                        pending[future] = input_path
+                    if not pending:
+                        break
+                    
+                    # Wake up periodically so a cancel is seen while long files run
+                    done, _ = wait(pending, timeout=self.CANCEL_POLL_INTERVAL,
+                                   return_when=FIRST_COMPLETED)
+                    if cancel_event.is_set():
+                        # Drop queued files; the ones already running still finish
+                        for future in pending:
+                            future.cancel()
+                    
+                    for future in done:
+                        input_path = pending.pop(future)
+                        if future.cancelled():
+                            continue
+                        try:
+                            success = future.result()
+                        except Exception as e:
+                            logger.error(f"Worker failed on {input_path}: {e}")
+                            success = False
+                        
+                        if success:
+                            processed_files.append(input_path)
+                        else:
+                            logger.error(f"Failed to process: {input_path}")
+                        progress.advance()
+        finally:
+            # Workers have exited, so every record they sent is already queued
+            log_listener.stop()
+        
+        return processed_files
+    
+    def _process_files_pipelined(self, jobs: List[Tuple[str, str]], new_artist: Optional[str],
+                                 new_album: Optional[str], progress: '_ProgressCounter',
+                                 cancel_event: threading.Event) -> List[str]:
+        """
+        Process (input_path, output_path) pairs with decoding, filtering and encoding overlapped.
+        
+        A decoder thread reads ahead and an encoder thread writes behind while
+        the calling thread filters. libsndfile releases the GIL, so the next
+        file decodes and the previous one encodes while the current one is
+        filtered. Bounded queues cap how many decoded files are held in memory.
+        Cancelling stops decoding; files already decoded are still written.
+        """
+        processed_files = []
+        decoded = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        filtered = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        
+        def decode():
+            for input_path, output_path in jobs:
+                if cancel_event.is_set():
+                    break
+                logger.info(f"Processing: {input_path}")
+                try:
+                    audio_data, sample_rate = self.load_audio(input_path)
+                except Exception as e:
+                    logger.error(f"Error processing file {input_path}: {e}")
+                    logger.error(f"Failed to process: {input_path}")
+                    progress.advance()
+                    continue
+                decoded.put((input_path, output_path, audio_data, sample_rate))
+            decoded.put(None)
+        
+        def encode():
+            while True:
+                item = filtered.get()
+                if item is None:
+                    return
+                input_path, output_path, audio_data, sample_rate = item
+                try:
+                    tags = self._build_mp3_tags(input_path, new_artist, new_album)
+                    self.save_audio(audio_data, sample_rate, output_path,
+                                    os.path.splitext(input_path)[1].lower(), tags)
+                except Exception as e:
+                    logger.error(f"Error processing file {input_path}: {e}")
+                    logger.error(f"Failed to process: {input_path}")
+                    progress.advance()
+                    continue
+                processed_files.append(input_path)
+                progress.advance()
+        
+        decoder = threading.Thread(target=decode, daemon=True)
+        encoder = threading.Thread(target=encode, daemon=True)
+        decoder.start()
+        encoder.start()
+        
+        try:
+            while True:
+                item = decoded.get()
+                if item is None:
+                    break
+                input_path, output_path, audio_data, sample_rate = item
+                try:
+                    audio_data = self.apply_notch_filter(audio_data, sample_rate)
+                except Exception as e:
+                    logger.error(f"Error processing file {input_path}: {e}")
+                    logger.error(f"Failed to process: {input_path}")
+                    progress.advance()
+                    continue
+                filtered.put((input_path, output_path, audio_data, sample_rate))
+        finally:
+            filtered.put(None)
+            encoder.join()
+        
+        return processed_files
+
 
+def _init_worker_logging(log_queue, level: int) -> None:
+    """Send a worker process's log records to the parent through log_queue."""
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+class _ForwardToLogger(logging.Handler):
+    """Hand records received from worker processes to the logger that created them."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+class _ProgressCounter:
+    """Thread-safe count of finished files, reported through an optional callback."""
+    
+    def __init__(self, total: int, callback: Optional[Callable[[int, int], None]] = None):
+        self.total = total
+        self.completed = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+    
+    def advance(self) -> None:
+        """Record one finished file and report the new count."""
+        with self._lock:
+            self.completed += 1
+            if self._callback is not None:
+                self._callback(self.completed, self.total)
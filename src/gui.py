@@ -3,21 +3,72 @@ GUI module for the Notched Music application using tkinter.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox
 import threading
 import os
+import queue
+import time
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
+from dataclasses import dataclass
 from typing import Optional
 
-from audio_processor import AudioProcessor
+from .audio_processor import AudioProcessor
 
 logger = logging.getLogger(__name__)
 
+# Directories last chosen in the Browse dialogs, kept between sessions
+LAST_DIRS_PATH = Path.home() / '.notched_music' / 'last_dirs.json'
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime at most once per second of record timestamps."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted time) for the most recent record
+        self._time_cache = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.default_time_format,
+                                      self.converter(record.created))
+            self._time_cache = (second, formatted)
+        if datefmt:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+@dataclass(frozen=True)
+class _Settings:
+    """Plain Python copy of the GUI variables, read from Tcl in one pass."""
+    input_dir: str
+    output_dir: str
+    notch_frequency: float
+    quality_factor: float
+    frequency_range: float
+    use_frequency_range: bool
+    new_artist: str
+    new_album: str
+    advanced_mode: bool
+
 
 class NotchedMusicGUI:
     """Main GUI class for the Notched Music application."""
     
+    # Milliseconds between drains of the worker-to-UI update queue
+    UI_POLL_INTERVAL_MS = 100
+    
+    # Grid options shared by the form rows, built once instead of per widget
+    _ROW_LABEL_GRID = {'column': 0, 'sticky': tk.W, 'pady': 5}
+    _ROW_CONTROL_GRID = {'column': 1, 'sticky': (tk.W, tk.E), 'padx': (5, 0)}
+    _SCALE_GRID = {'row': 0, 'column': 0, 'sticky': (tk.W, tk.E)}
+    _SCALE_ENTRY_GRID = {'row': 0, 'column': 1, 'padx': (5, 0)}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Notched Music - Audio Notch Filter")
@@ -38,11 +89,33 @@ class NotchedMusicGUI:
         # Audio processor
         self.audio_processor = None
         
-        # Processing state
+        # Starting directories for the Browse dialogs
+        last_dirs = self._load_last_dirs()
+        self._last_input_dir = last_dirs.get('input')
+        self._last_output_dir = last_dirs.get('output')
+        
+        # Processing state; runs go through a single-thread executor so each
+        # one is a future that can be cancelled between files
         self.is_processing = False
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._cancel = threading.Event()
+        self._future = None
+        
+        # (kind, payload) updates posted by the worker thread for the Tk thread
+        self._ui_queue = queue.Queue()
+        
+        # Widget styles are registered once rather than configured per widget
+        self.style = ttk.Style(self.root)
+        self.style.configure('Title.TLabel', font=("Arial", 16, "bold"))
         
         self.setup_ui()
         self.setup_logging()
+        
+        # Poll the UI queue from the Tk main thread
+        self._ui_poll_id = self.root.after(self.UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+        
+        # Stop processing cleanly when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -56,17 +129,16 @@ class NotchedMusicGUI:
         main_frame.columnconfigure(1, weight=1)
         
         # Title
-        title_label = ttk.Label(main_frame, text="Notched Music", 
-                               font=("Arial", 16, "bold"))
+        title_label = ttk.Label(main_frame, text="Notched Music", style='Title.TLabel')
         title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
         
         # Input directory selection
-        ttk.Label(main_frame, text="Input Directory:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        ttk.Label(main_frame, text="Input Directory:").grid(row=1, **self._ROW_LABEL_GRID)
         ttk.Entry(main_frame, textvariable=self.input_dir, width=50).grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5))
         ttk.Button(main_frame, text="Browse", command=self.browse_input_dir).grid(row=1, column=2, padx=(0, 0))
         
         # Output directory selection
-        ttk.Label(main_frame, text="Output Directory:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        ttk.Label(main_frame, text="Output Directory:").grid(row=2, **self._ROW_LABEL_GRID)
         ttk.Entry(main_frame, textvariable=self.output_dir, width=50).grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 5))
         ttk.Button(main_frame, text="Browse", command=self.browse_output_dir).grid(row=2, column=2, padx=(0, 0))
         
@@ -74,30 +146,30 @@ class NotchedMusicGUI:
         ttk.Separator(main_frame, orient='horizontal').grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=20)
         
         # Notch frequency
-        ttk.Label(main_frame, text="Notch Frequency (Hz):").grid(row=4, column=0, sticky=tk.W, pady=5)
+        ttk.Label(main_frame, text="Notch Frequency (Hz):").grid(row=4, **self._ROW_LABEL_GRID)
         frequency_frame = ttk.Frame(main_frame)
-        frequency_frame.grid(row=4, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
+        frequency_frame.grid(row=4, **self._ROW_CONTROL_GRID)
         frequency_frame.columnconfigure(0, weight=1)
         
         frequency_scale = ttk.Scale(frequency_frame, from_=20, to=20000, 
                                    variable=self.notch_frequency, orient=tk.HORIZONTAL)
-        frequency_scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        frequency_scale.grid(**self._SCALE_GRID)
         
         frequency_entry = ttk.Entry(frequency_frame, textvariable=self.notch_frequency, width=10)
-        frequency_entry.grid(row=0, column=1, padx=(5, 0))
+        frequency_entry.grid(**self._SCALE_ENTRY_GRID)
         
         # Quality factor
-        ttk.Label(main_frame, text="Quality Factor:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        ttk.Label(main_frame, text="Quality Factor:").grid(row=5, **self._ROW_LABEL_GRID)
         quality_frame = ttk.Frame(main_frame)
-        quality_frame.grid(row=5, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
+        quality_frame.grid(row=5, **self._ROW_CONTROL_GRID)
         quality_frame.columnconfigure(0, weight=1)
         
         quality_scale = ttk.Scale(quality_frame, from_=1, to=100, 
                                  variable=self.quality_factor, orient=tk.HORIZONTAL)
-        quality_scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        quality_scale.grid(**self._SCALE_GRID)
         
         quality_entry = ttk.Entry(quality_frame, textvariable=self.quality_factor, width=10)
-        quality_entry.grid(row=0, column=1, padx=(5, 0))
+        quality_entry.grid(**self._SCALE_ENTRY_GRID)
         
         # Frequency range controls
         range_frame = ttk.LabelFrame(main_frame, text="Notch Width Control", padding="5")
@@ -115,18 +187,18 @@ class NotchedMusicGUI:
         
         # Frequency range controls (initially disabled)
         self.range_label = ttk.Label(range_frame, text="Frequency Range (Hz):")
-        self.range_label.grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.range_label.grid(row=2, **self._ROW_LABEL_GRID)
         
         range_control_frame = ttk.Frame(range_frame)
-        range_control_frame.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
+        range_control_frame.grid(row=2, **self._ROW_CONTROL_GRID)
         range_control_frame.columnconfigure(0, weight=1)
         
         self.range_scale = ttk.Scale(range_control_frame, from_=1, to=500, 
                                     variable=self.frequency_range, orient=tk.HORIZONTAL)
-        self.range_scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.range_scale.grid(**self._SCALE_GRID)
         
         self.range_entry = ttk.Entry(range_control_frame, textvariable=self.frequency_range, width=10)
-        self.range_entry.grid(row=0, column=1, padx=(5, 0))
+        self.range_entry.grid(**self._SCALE_ENTRY_GRID)
         
         # Initially disable range controls
         self.toggle_range_mode()
@@ -142,12 +214,12 @@ class NotchedMusicGUI:
         self.advanced_frame.columnconfigure(1, weight=1)
         
         # Artist name
-        ttk.Label(self.advanced_frame, text="New Artist Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        ttk.Entry(self.advanced_frame, textvariable=self.new_artist, width=40).grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
+        ttk.Label(self.advanced_frame, text="New Artist Name:").grid(row=0, **self._ROW_LABEL_GRID)
+        ttk.Entry(self.advanced_frame, textvariable=self.new_artist, width=40).grid(row=0, **self._ROW_CONTROL_GRID)
         
         # Album name
-        ttk.Label(self.advanced_frame, text="New Album Name:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        ttk.Entry(self.advanced_frame, textvariable=self.new_album, width=40).grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
+        ttk.Label(self.advanced_frame, text="New Album Name:").grid(row=1, **self._ROW_LABEL_GRID)
+        ttk.Entry(self.advanced_frame, textvariable=self.new_album, width=40).grid(row=1, **self._ROW_CONTROL_GRID)
         
         # Initially hide advanced options
         self.advanced_frame.grid_remove()
@@ -174,39 +246,112 @@ class NotchedMusicGUI:
         log_frame.rowconfigure(0, weight=1)
         main_frame.rowconfigure(12, weight=1)
         
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, width=70)
+        # Append-only log: no undo stack and no line wrapping to recompute per insert
+        self.log_text = tk.Text(log_frame, height=10, width=70, undo=False, maxundo=0,
+                                autoseparators=False, wrap='none')
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        log_y_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        log_y_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        log_x_scrollbar = ttk.Scrollbar(log_frame, orient=tk.HORIZONTAL, command=self.log_text.xview)
+        log_x_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.log_text.config(yscrollcommand=log_y_scrollbar.set, xscrollcommand=log_x_scrollbar.set)
     
     def setup_logging(self):
         """Set up logging to display in the GUI."""
         # Create a custom handler for the GUI
         class GUILogHandler(logging.Handler):
+            # Milliseconds between flushes of queued records into the widget
+            FLUSH_INTERVAL_MS = 50
+            # Lines kept in the widget; older lines are trimmed from the top
+            MAX_LINES = 2000
+            
             def __init__(self, text_widget):
                 super().__init__()
                 self.text_widget = text_widget
+                # Records can come from any thread; only the Tk thread touches the widget
+                self.pending = queue.SimpleQueue()
+                self.flush_id = None
             
             def emit(self, record):
-                msg = self.format(record)
-                self.text_widget.insert(tk.END, msg + '\n')
-                self.text_widget.see(tk.END)
-        
-        # Add handler to logger
-        gui_handler = GUILogHandler(self.log_text)
-        gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logger.addHandler(gui_handler)
-        logger.setLevel(logging.INFO)
+                try:
+                    self.pending.put(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            
+            def flush_pending(self):
+                """Write all queued records with a single insert and see, trim, then reschedule."""
+                lines = []
+                while True:
+                    try:
+                        lines.append(self.pending.get_nowait())
+                    except queue.Empty:
+                        break
+                if lines:
+                    self.text_widget.insert(tk.END, '\n'.join(lines) + '\n')
+                    # Keep the widget bounded so inserts stay cheap on long runs
+                    line_count = int(self.text_widget.index('end-1c').split('.')[0])
+                    if line_count > self.MAX_LINES:
+                        self.text_widget.delete('1.0', f'end-{self.MAX_LINES}l')
+                    self.text_widget.see(tk.END)
+                self.flush_id = self.text_widget.after(self.FLUSH_INTERVAL_MS, self.flush_pending)
+            
+            def stop(self):
+                """Cancel the scheduled flush, before the widget is destroyed."""
+                if self.flush_id is not None:
+                    self.text_widget.after_cancel(self.flush_id)
+                    self.flush_id = None
+        
+        # Add handler to the package logger, so records from the audio processor
+        # and its worker processes reach the log pane as well as this module's
+        self._log_handler = GUILogHandler(self.log_text)
+        self._log_handler.setFormatter(
+            _CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s'))
+        package_logger = logging.getLogger(__package__)
+        package_logger.addHandler(self._log_handler)
+        package_logger.setLevel(logging.INFO)
+        
+        # Start the periodic flush from the Tk main thread
+        self._log_handler.flush_pending()
+    
+    @staticmethod
+    def _load_last_dirs() -> dict:
+        """Read the directories saved by the Browse dialogs, if any."""
+        try:
+            last_dirs = json.loads(LAST_DIRS_PATH.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return last_dirs if isinstance(last_dirs, dict) else {}
+    
+    def _save_last_dirs(self):
+        """Persist the Browse dialog directories for the next session."""
+        try:
+            LAST_DIRS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            LAST_DIRS_PATH.write_text(json.dumps({'input': self._last_input_dir,
+                                                  'output': self._last_output_dir}),
+                                      encoding='utf-8')
+        except OSError as e:
+            logger.debug(f"Could not save last directories: {e}")
     
     def browse_input_dir(self):
         """Browse for input directory."""
-        directory = filedialog.askdirectory(title="Select Input Directory")
+        directory = filedialog.askdirectory(title="Select Input Directory",
+                                            initialdir=self._last_input_dir or os.path.expanduser('~'),
+                                            mustexist=True)
         if directory:
             self.input_dir.set(directory)
+            self._last_input_dir = directory
+            self._save_last_dirs()
     
     def browse_output_dir(self):
         """Browse for output directory."""
-        directory = filedialog.askdirectory(title="Select Output Directory")
+        directory = filedialog.askdirectory(title="Select Output Directory",
+                                            initialdir=self._last_output_dir or os.path.expanduser('~'),
+                                            mustexist=True)
         if directory:
             self.output_dir.set(directory)
+            self._last_output_dir = directory
+            self._save_last_dirs()
     
     def toggle_advanced(self):
         """Toggle advanced options visibility."""
@@ -228,29 +373,46 @@ class NotchedMusicGUI:
             self.range_scale.config(state='disabled')
             self.range_entry.config(state='disabled')
     
-    def validate_inputs(self) -> bool:
+    def _snapshot(self) -> _Settings:
+        """Read every Tk variable once (one Tcl round-trip each)."""
+        return _Settings(
+            input_dir=self.input_dir.get(),
+            output_dir=self.output_dir.get(),
+            notch_frequency=self.notch_frequency.get(),
+            quality_factor=self.quality_factor.get(),
+            frequency_range=self.frequency_range.get(),
+            use_frequency_range=self.use_frequency_range.get(),
+            new_artist=self.new_artist.get(),
+            new_album=self.new_album.get(),
+            advanced_mode=self.advanced_mode.get()
+        )
+    
+    def validate_inputs(self, settings: Optional[_Settings] = None) -> bool:
         """Validate user inputs."""
-        if not self.input_dir.get():
+        if settings is None:
+            settings = self._snapshot()
+        
+        if not settings.input_dir:
             messagebox.showerror("Error", "Please select an input directory")
             return False
         
-        if not self.output_dir.get():
+        if not settings.output_dir:
             messagebox.showerror("Error", "Please select an output directory")
             return False
         
-        if not os.path.exists(self.input_dir.get()):
+        if not Path(settings.input_dir).is_dir():
             messagebox.showerror("Error", "Input directory does not exist")
             return False
         
-        if self.notch_frequency.get() <= 0:
+        if settings.notch_frequency <= 0:
             messagebox.showerror("Error", "Notch frequency must be greater than 0")
             return False
         
-        if self.quality_factor.get() <= 0:
+        if settings.quality_factor <= 0:
             messagebox.showerror("Error", "Quality factor must be greater than 0")
             return False
         
-        if self.use_frequency_range.get() and self.frequency_range.get() <= 0:
+        if settings.use_frequency_range and settings.frequency_range <= 0:
             messagebox.showerror("Error", "Frequency range must be greater than 0")
             return False
         
@@ -258,7 +420,9 @@ class NotchedMusicGUI:
     
     def start_processing(self):
         """Start the audio processing in a separate thread."""
-        if not self.validate_inputs():
+        # Snapshot the variables on the Tk thread; the worker only sees plain values
+        settings = self._snapshot()
+        if not self.validate_inputs(settings):
             return
         
         if self.is_processing:
@@ -269,60 +433,117 @@ class NotchedMusicGUI:
         self.process_button.config(state='disabled')
         self.is_processing = True
         
-        # Start processing in a separate thread
-        thread = threading.Thread(target=self.process_audio_files)
-        thread.daemon = True
-        thread.start()
+        # Start processing on the executor's worker thread
+        self._cancel.clear()
+        self._future = self._executor.submit(self.process_audio_files, settings)
     
-    def process_audio_files(self):
+    def _on_close(self):
+        """Cancel any run in progress and close the window."""
+        # Files already being written are finished before the process exits;
+        # the rest of the batch is skipped
+        self._cancel.set()
+        self._executor.shutdown(wait=False)
+        
+        # Stop the polling loops and detach the log pane, so nothing keeps
+        # running against destroyed widgets if the Tk interpreter outlives them
+        self.root.after_cancel(self._ui_poll_id)
+        logging.getLogger(__package__).removeHandler(self._log_handler)
+        self._log_handler.stop()
+        self.root.destroy()
+    
+    def report_progress(self, completed: int, total: int):
+        """Report per-file progress from the processing thread to the Tk thread."""
+        self._ui_queue.put(("progress", completed))
+    
+    def _drain_ui_queue(self):
+        """Apply all queued worker updates on the Tk thread, then reschedule."""
+        while True:
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "status":
+                self.status_label.config(text=payload)
+            elif kind == "progress":
+                self.progress_var.set(payload)
+            elif kind == "maximum":
+                self.progress_bar.config(maximum=payload)
+            elif kind == "info":
+                messagebox.showinfo(*payload)
+            elif kind == "error":
+                messagebox.showerror(*payload)
+            elif kind == "done":
+                self.process_button.config(state='normal')
+        self._ui_poll_id = self.root.after(self.UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+    
+    def process_audio_files(self, settings: _Settings):
         """Process audio files (runs in separate thread)."""
         try:
             # Update status
-            self.root.after(0, lambda: self.status_label.config(text="Initializing..."))
+            self._ui_queue.put(("status", "Initializing..."))
             
-            # Create audio processor
-            frequency_range = self.frequency_range.get() if self.use_frequency_range.get() else None
+            # Create audio processor; filter designs are cached per parameter set
+            # in audio_processor, so nothing is lost by building a new one per run
+            frequency_range = settings.frequency_range if settings.use_frequency_range else None
             self.audio_processor = AudioProcessor(
-                notch_frequency=self.notch_frequency.get(),
-                quality_factor=self.quality_factor.get(),
+                notch_frequency=settings.notch_frequency,
+                quality_factor=settings.quality_factor,
                 frequency_range=frequency_range
             )
             
             # Get advanced options
-            new_artist = self.new_artist.get() if self.advanced_mode.get() and self.new_artist.get() else None
-            new_album = self.new_album.get() if self.advanced_mode.get() and self.new_album.get() else None
+            new_artist = settings.new_artist if settings.advanced_mode and settings.new_artist else None
+            new_album = settings.new_album if settings.advanced_mode and settings.new_album else None
             
-            # Update status
-            self.root.after(0, lambda: self.status_label.config(text="Processing audio files..."))
+            # Enumerate the files up front so progress can be reported per file
+            input_dir = settings.input_dir
+            output_dir = settings.output_dir
+            os.makedirs(output_dir, exist_ok=True)
+            jobs = self.audio_processor.list_files(input_dir, output_dir)
+            logger.info(f"Found {len(jobs)} audio files to process")
             
-            # Process files
-            processed_files = self.audio_processor.process_directory(
-                self.input_dir.get(),
-                self.output_dir.get(),
+            # Update status; the bar counts files, advancing by one per completed file
+            self._ui_queue.put(("maximum", max(len(jobs), 1)))
+            self._ui_queue.put(("progress", 0))
+            self._ui_queue.put(("status", "Processing audio files..."))
+            
+            # Process files in a pool of worker processes, one file per task;
+            # this thread only waits on results, leaving the Tk thread free
+            processed_files = self.audio_processor.process_files(
+                jobs,
                 new_artist,
-                new_album
+                new_album,
+                max_workers=os.cpu_count(),
+                progress_callback=self.report_progress,
+                cancel_event=self._cancel
             )
             
+            if self._cancel.is_set():
+                self._ui_queue.put((
+                    "status", f"Processing cancelled. {len(processed_files)} files processed."
+                ))
+                return
+            
             # Update status
-            self.root.after(0, lambda: self.status_label.config(
-                text=f"Processing complete! {len(processed_files)} files processed successfully."
+            self._ui_queue.put((
+                "status", f"Processing complete! {len(processed_files)} files processed successfully."
             ))
             
             # Show completion message
-            self.root.after(0, lambda: messagebox.showinfo(
+            self._ui_queue.put(("info", (
                 "Success", 
-                f"Processing complete!\n\n{len(processed_files)} files processed successfully.\n\nOutput saved to: {self.output_dir.get()}"
-            ))
+                f"Processing complete!\n\n{len(processed_files)} files processed successfully.\n\nOutput saved to: {output_dir}"
+            )))
             
         except Exception as e:
             error_msg = f"Error during processing: {str(e)}"
             logger.error(error_msg)
-            self.root.after(0, lambda: self.status_label.config(text="Error occurred during processing"))
-            self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
+            self._ui_queue.put(("status", "Error occurred during processing"))
+            self._ui_queue.put(("error", ("Error", error_msg)))
         
         finally:
             # Re-enable the process button
-            self.root.after(0, lambda: self.process_button.config(state='normal'))
+            self._ui_queue.put(("done", None))
             self.is_processing = False
 
 
@@ -4,16 +4,17 @@ Main entry point for the Notched Music application.
 
 import sys
 import logging
-from pathlib import Path
+import multiprocessing
 
-# Add src directory to path for imports
-src_path = Path(__file__).parent
-sys.path.insert(0, str(src_path))
+from .gui import main as gui_main
 
-from gui import main as gui_main
 
 def main():
     """Main entry point."""
+    # Frozen builds re-run the executable for each spawned worker process;
+    # this hands those runs to multiprocessing instead of starting the GUI
+    multiprocessing.freeze_support()
+    
     # Set up basic logging
     logging.basicConfig(
         level=logging.INFO,
@@ -10,6 +10,7 @@ import numpy as np
 import threading
 import time
 import math
+from contextlib import contextmanager
 from typing import Optional
 
 try:
@@ -22,6 +23,26 @@ except ImportError:
 class TinnitusFrequencyIdentifier:
     """Tinnitus frequency identifier with vintage stereo receiver aesthetic."""
     
+    # Notch partials sit this fraction below and above the tone, out of
+    # phase with it
+    _NOTCH_SPREAD = 0.05
+    # Largest notch partial gain relative to the tone (a 20% reduction)
+    _NOTCH_GAIN = 0.2
+    # Scale from quality factor to a 0-1 notch strength
+    _Q_NORM = 0.01
+    # Seconds for one full sweep across the frequency range
+    SWEEP_DURATION = 2.0
+    # Frames per audio callback requested from the output stream. A power of
+    # two suits NumPy's vector loops; any analysis added on these blocks
+    # should likewise use FFT-friendly lengths such as 512, 1024 or 2048
+    BLOCK_SIZE = 1024
+    # Byte alignment of the audio callback's scratch buffers
+    BUFFER_ALIGNMENT = 32
+    # Milliseconds between checks for stream status flags from the audio thread
+    STATUS_POLL_INTERVAL_MS = 500
+    # Entries in the loudness weighting table, log-spaced over 20 Hz - 20 kHz
+    WEIGHT_TABLE_SIZE = 4096
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Tinnitus Frequency Identifier")
@@ -38,19 +59,51 @@ class TinnitusFrequencyIdentifier:
         self.is_playing = False
         self.audio_stream = None
         
+        # Oscillator phase in radians, carried from one audio block to the
+        # next so the tone stays continuous. The notch partials are derived
+        # from it, so it is wrapped to a whole period of the slowest one
+        self.phase_main = 0.0
+        self._phase_period = 2 * np.pi / self._NOTCH_SPREAD
+        # Samples rendered since playback started; drives the sweep position
+        self._sample_pos = 0
+        # Scratch buffers reused by every audio callback
+        self._allocate_buffers(self.BLOCK_SIZE)
+        
+        # get_frequency_weighting sampled at log-spaced frequencies, so the
+        # audio thread can weight every sample with a table lookup
+        self._weight_log_min = math.log2(20)
+        self._weight_log_step = (math.log2(20000) - self._weight_log_min) / (self.WEIGHT_TABLE_SIZE - 1)
+        weight_freqs = np.logspace(math.log2(20), math.log2(20000), self.WEIGHT_TABLE_SIZE, base=2)
+        # Keep the end points inside the weighted band despite logspace rounding
+        np.clip(weight_freqs, 20, 20000, out=weight_freqs)
+        self._weight_lut = self.get_frequency_weightings(weight_freqs).astype(np.float32)
+        
+        # Values derived from the controls, read by the audio thread
+        self._update_cached_params()
+        
         # GUI variables
         self.freq_var = tk.DoubleVar(value=self.frequency)
         self.q_var = tk.DoubleVar(value=self.quality_factor)
         self.hz_range_var = tk.DoubleVar(value=self.frequency_range_hz)
         self.octave_range_var = tk.DoubleVar(value=self.frequency_range_octaves)
         
-        # Update flags to prevent circular updates
-        self.updating_q = False
-        self.updating_hz = False
-        self.updating_octave = False
+        # Nonzero while the range controls are being synced, so the writes
+        # do not re-enter the handlers
+        self._suppress_depth = 0
+        
+        # Set while a display update is queued, so a burst of slider events
+        # is painted once
+        self._redraw_pending = False
+        
+        # Stream status flags recorded by the audio thread, and how many of
+        # them the UI has already reported
+        self._last_status = None
+        self._status_events = 0
+        self._status_reported = 0
         
         self.setup_vintage_ui()
         self.update_range_displays()
+        self.root.after(self.STATUS_POLL_INTERVAL_MS, self._drain_status)
         
     def setup_vintage_ui(self):
         """Set up the vintage stereo receiver interface."""
@@ -150,50 +203,87 @@ class TinnitusFrequencyIdentifier:
         self.scale_canvas = tk.Canvas(parent, height=80, bg='#000000', highlightthickness=0)
         self.scale_canvas.pack(fill='x', padx=10)
         
+        # Canvas items are created on the first draw and then only moved
+        self._scale_items = None
+        self._scale_width = None
+        self.scale_canvas.bind('<Configure>', lambda event: self.schedule_display_update())
+        
         # Draw frequency scale
         self.draw_frequency_scale()
         
+    def _create_scale_items(self):
+        """Create the frequency scale's background and indicators once."""
+        canvas = self.scale_canvas
+        
+        # Frequency scale background, then bright yellow tuning indicator and
+        # range indicators
+        self._scale_items = {
+            'background': canvas.create_rectangle(0, 0, 0, 0, fill='#000000', outline='#333333'),
+            'indicator': canvas.create_line(0, 0, 0, 0, fill='#FFFF00', width=3),
+            'lower': canvas.create_line(0, 0, 0, 0, fill='#FFFF00', width=2),
+            'upper': canvas.create_line(0, 0, 0, 0, fill='#FFFF00', width=2),
+        }
+        
+    def _create_scale_marks(self, width, height):
+        """Create the scale's frequency markings, tagged 'marks', for a canvas width."""
+        canvas = self.scale_canvas
+        freq_min, freq_max = 20, 20000
+        scale = (width - 40) / (freq_max - freq_min)
+        
+        # Major markings every 1000 Hz, labelled every 2 kHz
+        for freq in range(1000, 20001, 1000):
+            x = (freq - freq_min) * scale + 20
+            canvas.create_line(x, height-20, x, height-5, fill='#00FF00', width=2, tags='marks')
+            if freq % 2000 == 0:
+                canvas.create_text(x, height-25, text=f"{freq//1000}k",
+                                   fill='#00FF00', font=('Arial', 8, 'bold'), tags='marks')
+        
+        # Keep the markings between the background and the indicators
+        canvas.tag_raise('marks', self._scale_items['background'])
+        
     def draw_frequency_scale(self):
         """Draw the frequency scale with markings."""
-        self.scale_canvas.delete("all")
-        
         width = self.scale_canvas.winfo_width()
         if width <= 1:  # Canvas not yet sized
             self.root.after(100, self.draw_frequency_scale)
             return
             
         height = 80
+        canvas = self.scale_canvas
+        if self._scale_items is None:
+            self._create_scale_items()
+        items = self._scale_items
         
-        # Draw frequency scale background
-        self.scale_canvas.create_rectangle(0, 0, width, height, fill='#000000', outline='#333333')
-        
-        # Draw frequency markings (20 Hz to 20 kHz)
+        # Frequency markings (20 Hz to 20 kHz)
         freq_min, freq_max = 20, 20000
+        scale = (width - 40) / (freq_max - freq_min)
+        
+        # The background and markings only move when the canvas is resized;
+        # the markings are stretched about the 20 Hz edge in a single call
+        if width != self._scale_width:
+            old_span = (self._scale_width or 0) - 40
+            self._scale_width = width
+            canvas.coords(items['background'], 0, 0, width, height)
+            if old_span > 0 and width - 40 > 0:
+                canvas.scale('marks', 20, 0, (width - 40) / old_span, 1)
+            else:
+                canvas.delete('marks')
+                self._create_scale_marks(width, height)
         
-        # Major markings every 1000 Hz
-        for freq in range(1000, 20001, 1000):
-            x = (freq - freq_min) / (freq_max - freq_min) * (width - 40) + 20
-            self.scale_canvas.create_line(x, height-20, x, height-5, fill='#00FF00', width=2)
-            
-            # Frequency labels
-            if freq % 2000 == 0:  # Show every 2kHz
-                self.scale_canvas.create_text(x, height-25, text=f"{freq//1000}k", 
-                                            fill='#00FF00', font=('Arial', 8, 'bold'))
-        
-        # Draw bright yellow tuning indicator
+        # Move the tuning indicator
         current_freq = self.frequency
-        indicator_x = (current_freq - freq_min) / (freq_max - freq_min) * (width - 40) + 20
-        self.scale_canvas.create_line(indicator_x, 5, indicator_x, height-30, fill='#FFFF00', width=3)
+        indicator_x = (current_freq - freq_min) * scale + 20
+        canvas.coords(items['indicator'], indicator_x, 5, indicator_x, height-30)
         
-        # Draw range indicators (bright yellow)
+        # Move the range indicators, hiding those off the scale
         range_hz = self.frequency_range_hz
-        lower_x = ((current_freq - range_hz) - freq_min) / (freq_max - freq_min) * (width - 40) + 20
-        upper_x = ((current_freq + range_hz) - freq_min) / (freq_max - freq_min) * (width - 40) + 20
+        lower_x = ((current_freq - range_hz) - freq_min) * scale + 20
+        upper_x = ((current_freq + range_hz) - freq_min) * scale + 20
         
-        if lower_x >= 20:
-            self.scale_canvas.create_line(lower_x, height-15, lower_x, height-5, fill='#FFFF00', width=2)
-        if upper_x <= width - 20:
-            self.scale_canvas.create_line(upper_x, height-15, upper_x, height-5, fill='#FFFF00', width=2)
+        canvas.coords(items['lower'], lower_x, height-15, lower_x, height-5)
+        canvas.itemconfig(items['lower'], state='normal' if lower_x >= 20 else 'hidden')
+        canvas.coords(items['upper'], upper_x, height-15, upper_x, height-5)
+        canvas.itemconfig(items['upper'], state='normal' if upper_x <= width - 20 else 'hidden')
         
     def setup_controls(self, parent):
         """Set up the control knobs and switches like the National Panasonic."""
@@ -376,70 +466,62 @@ class TinnitusFrequencyIdentifier:
     def on_frequency_change(self, value):
         """Handle frequency knob changes."""
         self.frequency = float(value)
-        self.update_range_displays()
+        self._update_cached_params()
+        self.schedule_display_update()
         
     def on_q_change(self, value):
         """Handle quality factor changes."""
-        if self.updating_q:
-            return
-            
-        self.updating_hz = True
-        self.updating_octave = True
-        
-        self.quality_factor = float(value)
-        self.frequency_range_hz = self.frequency / self.quality_factor
-        self.frequency_range_octaves = self.hz_to_octaves(self.frequency_range_hz)
-        
-        self.hz_range_var.set(self.frequency_range_hz)
-        self.octave_range_var.set(self.frequency_range_octaves)
-        
-        self.update_range_displays()
-        
-        self.updating_hz = False
-        self.updating_octave = False
+        if not self._suppress_depth:
+            self._sync_range('q', float(value))
         
     def on_hz_range_change(self, value):
         """Handle Hz range changes."""
-        if self.updating_hz:
-            return
-            
-        self.updating_q = True
-        self.updating_octave = True
-        
-        self.frequency_range_hz = float(value)
-        self.quality_factor = self.frequency / self.frequency_range_hz
-        self.frequency_range_octaves = self.hz_to_octaves(self.frequency_range_hz)
-        
-        self.q_var.set(self.quality_factor)
-        self.octave_range_var.set(self.frequency_range_octaves)
-        
-        self.update_range_displays()
-        
-        self.updating_q = False
-        self.updating_octave = False
+        if not self._suppress_depth:
+            self._sync_range('hz', float(value))
         
     def on_octave_range_change(self, value):
         """Handle octave range changes."""
-        if self.updating_octave:
-            return
-            
-        self.updating_q = True
-        self.updating_hz = True
+        if not self._suppress_depth:
+            self._sync_range('octave', float(value))
         
-        self.frequency_range_octaves = float(value)
-        self.frequency_range_hz = self.octaves_to_hz(self.frequency_range_octaves)
-        if self.frequency_range_hz > 0:
+    @contextmanager
+    def _suppress(self):
+        """Ignore range control callbacks while the block runs."""
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+        
+    def _sync_range(self, source, value):
+        """Set one of the Q, Hz range and octave range controls and derive the other two."""
+        if source == 'q':
+            self.quality_factor = value
+            self.frequency_range_hz = self.frequency / self.quality_factor
+            self.frequency_range_octaves = self.hz_to_octaves(self.frequency_range_hz)
+        elif source == 'hz':
+            self.frequency_range_hz = value
             self.quality_factor = self.frequency / self.frequency_range_hz
+            self.frequency_range_octaves = self.hz_to_octaves(self.frequency_range_hz)
         else:
-            self.quality_factor = 1.0
-        
-        self.q_var.set(self.quality_factor)
-        self.hz_range_var.set(self.frequency_range_hz)
+            self.frequency_range_octaves = value
+            self.frequency_range_hz = self.octaves_to_hz(self.frequency_range_octaves)
+            if self.frequency_range_hz > 0:
+                self.quality_factor = self.frequency / self.frequency_range_hz
+            else:
+                self.quality_factor = 1.0
         
-        self.update_range_displays()
+        # Write back only the derived controls
+        with self._suppress():
+            if source != 'q':
+                self.q_var.set(self.quality_factor)
+            if source != 'hz':
+                self.hz_range_var.set(self.frequency_range_hz)
+            if source != 'octave':
+                self.octave_range_var.set(self.frequency_range_octaves)
+        self._update_cached_params()
         
-        self.updating_q = False
-        self.updating_hz = False
+        self.schedule_display_update()
         
     def toggle_power(self):
         """Toggle power on/off."""
@@ -488,10 +570,30 @@ class TinnitusFrequencyIdentifier:
             weight = 1.0 - (f - 4000) / 16000 * 0.6
             
         # Ensure weight is within reasonable bounds
-        weight = max(0.1, min(2.0, weight))
+        weight = 0.1 if weight < 0.1 else (2.0 if weight > 2.0 else weight)
+        
+        return weight
         
+    def get_frequency_weightings(self, frequencies):
+        """Calculate get_frequency_weighting for an array of frequencies at once."""
+        f = np.asarray(frequencies, dtype=np.float64)
+        weight = np.where(f < 1000, 1.0 + (1000 - f) / 1000 * 0.8,
+                          np.where(f < 4000, 1.0, 1.0 - (f - 4000) / 16000 * 0.6))
+        np.clip(weight, 0.1, 2.0, out=weight)
+        weight[(f < 20) | (f > 20000)] = 0.1  # Out-of-range frequencies
         return weight
         
+    def schedule_display_update(self):
+        """Coalesce display updates until Tk is idle."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_display_update)
+    
+    def _do_display_update(self):
+        """Run the queued display update."""
+        self._redraw_pending = False
+        self.update_range_displays()
+    
     def update_range_displays(self):
         """Update all range displays."""
         # Update main frequency display to show sweep range
@@ -527,11 +629,19 @@ class TinnitusFrequencyIdentifier:
             self.is_playing = True
             self.power_button.config(text="ON", bg='#00FF00', fg='#000000')
             
-            # Start audio stream
+            # Start the sweep from its lower bound
+            self._sample_pos = 0
+            
+            # Start audio stream with a fixed block size, so the callback's
+            # scratch buffers never need to be reallocated, and low latency
+            # for a steady callback cadence
+            self._allocate_buffers(self.BLOCK_SIZE)
             self.audio_stream = sd.OutputStream(
                 samplerate=self.sample_rate,
                 channels=1,
                 dtype=np.float32,
+                blocksize=self.BLOCK_SIZE,
+                latency='low',
                 callback=self.audio_callback
             )
             self.audio_stream.start()
@@ -549,59 +659,145 @@ class TinnitusFrequencyIdentifier:
             self.audio_stream.close()
             self.audio_stream = None
             
+    def _drain_status(self):
+        """Report stream status flags recorded by the audio callback."""
+        events = self._status_events
+        if events != self._status_reported:
+            print(f"Audio status: {self._last_status} ({events - self._status_reported} callbacks)")
+            self._status_reported = events
+        self.root.after(self.STATUS_POLL_INTERVAL_MS, self._drain_status)
+    
+    def _update_cached_params(self):
+        """Recompute the per-block constants that depend only on the controls.
+        
+        Runs on the UI thread whenever a control changes. The results are
+        published as one immutable tuple, so the audio thread reads a
+        consistent set with a single attribute load and never takes a lock.
+        """
+        sweep_lower = max(20, self.frequency - self.frequency_range_hz)
+        sweep_upper = min(20000, self.frequency + self.frequency_range_hz)
+        if sweep_lower > 0 and sweep_upper > sweep_lower:
+            log_lower = math.log2(sweep_lower)
+            log_span = math.log2(sweep_upper) - log_lower
+        else:
+            # No usable range; the sweep stays on the centre frequency
+            log_lower = math.log2(self.frequency)
+            log_span = 0.0
+        if self.quality_factor > 1:
+            # Normalize Q to 0-1 and scale to the maximum notch gain
+            notch_depth = min(self.quality_factor * self._Q_NORM, 1.0) * self._NOTCH_GAIN
+        else:
+            notch_depth = 0.0
+        self._params = (log_lower, log_span, notch_depth, self.amplitude)
+    
+    @classmethod
+    def _aligned_empty(cls, frames, dtype):
+        """Return an uninitialised array whose data starts on a BUFFER_ALIGNMENT boundary."""
+        itemsize = np.dtype(dtype).itemsize
+        raw = np.empty(frames * itemsize + cls.BUFFER_ALIGNMENT, dtype=np.uint8)
+        offset = -raw.ctypes.data % cls.BUFFER_ALIGNMENT
+        return raw[offset:offset + frames * itemsize].view(dtype)
+    
+    def _allocate_buffers(self, frames):
+        """Allocate the audio callback's scratch buffers for blocks of up to frames samples."""
+        # Sample offsets 0..frames-1 within a block. Samples are float32, the
+        # stream's format, which also selects NumPy's faster float32 sin loop;
+        # phase sums and the running phases between blocks are float64
+        self._ramp = self._aligned_empty(frames, np.float32)
+        self._ramp[:] = np.arange(frames)
+        self._buf_freq = self._aligned_empty(frames, np.float32)
+        self._buf_weight = self._aligned_empty(frames, np.float32)
+        self._buf_index = self._aligned_empty(frames, np.intp)
+        self._buf_cum = self._aligned_empty(frames, np.float64)
+        self._buf_phase = self._aligned_empty(frames, np.float32)
+        self._buf_main = self._aligned_empty(frames, np.float32)
+        self._buf_env = self._aligned_empty(frames, np.float32)
+    
     def audio_callback(self, outdata, frames, time, status):
         """Audio callback function."""
         if status:
-            print(f"Audio status: {status}")
+            # Printing here could block the real-time thread; record the flags
+            # for _drain_status to report from the UI thread
+            self._last_status = status
+            self._status_events += 1
             
         if self.is_playing:
-            # Generate frequency sweep across the defined range
-            t = np.arange(frames) / self.sample_rate
+            log_lower, log_span, notch_depth, amplitude = self._params
             
-            # Calculate frequency range boundaries
-            lower_freq = max(20, self.frequency - self.frequency_range_hz)
-            upper_freq = min(20000, self.frequency + self.frequency_range_hz)
+            # Work in preallocated buffers; the hot path allocates nothing
+            if frames > len(self._ramp):
+                self._allocate_buffers(frames)
+            ramp = self._ramp[:frames]
+            freq = self._buf_freq[:frames]
+            cum = self._buf_cum[:frames]
+            phase = self._buf_phase[:frames]
+            weight = self._buf_weight[:frames]
+            index = self._buf_index[:frames]
+            main_tone = self._buf_main[:frames]
             
-            # Create frequency sweep pattern
-            # Use logarithmic sweep for more natural progression
-            sweep_duration = 2.0  # 2 seconds for full sweep cycle
-            sweep_phase = (time.inputBufferAdcTime % sweep_duration) / sweep_duration
+            # Create frequency sweep pattern from the position in the stream;
+            # the callback's time argument has no input timestamps on an
+            # output-only stream, so count rendered samples instead. Each
+            # sample gets its own position in the sweep cycle
+            sweep_samples = int(self.SWEEP_DURATION * self.sample_rate)
+            start = self._sample_pos % sweep_samples
+            self._sample_pos += frames
+            np.add(ramp, np.float32(start), out=freq)
+            freq *= np.float32(1.0 / sweep_samples)
+            np.floor(freq, out=phase)
+            freq -= phase
             
-            # Logarithmic frequency sweep
-            if lower_freq > 0 and upper_freq > lower_freq:
-                log_lower = math.log10(lower_freq)
-                log_upper = math.log10(upper_freq)
-                current_log_freq = log_lower + sweep_phase * (log_upper - log_lower)
-                current_freq = 10 ** current_log_freq
-            else:
-                current_freq = self.frequency
+            # Logarithmic frequency sweep for more natural progression, between
+            # bounds whose base-2 logs are cached when the controls change
+            freq *= np.float32(log_span)
+            freq += np.float32(log_lower)
+            
+            # Look up each sample's frequency weighting for equal perceived
+            # loudness from its log frequency, scaled by the amplitude
+            np.subtract(freq, np.float32(self._weight_log_min), out=phase)
+            phase *= np.float32(1.0 / self._weight_log_step)
+            phase += np.float32(0.5)
+            # Clamp with a min/max pair, about twice as fast as np.clip here
+            np.maximum(phase, np.float32(0), out=phase)
+            np.minimum(phase, np.float32(self.WEIGHT_TABLE_SIZE - 1), out=phase)
+            index[...] = phase
+            np.take(self._weight_lut, index, out=weight)
+            weight *= np.float32(amplitude)
             
-            # Apply frequency weighting for equal perceived loudness
-            frequency_weight = self.get_frequency_weighting(current_freq)
-            weighted_amplitude = self.amplitude * frequency_weight
+            np.exp2(freq, out=freq)
             
-            # Generate the main tone at current sweep frequency
-            main_tone = weighted_amplitude * np.sin(2 * np.pi * current_freq * t)
+            # Integrate the instantaneous frequency into phase, so the sweep is
+            # continuous within and across blocks: cum[i] is the phase advance
+            # before sample i
+            freq *= np.float32(2 * np.pi / self.sample_rate)
+            np.cumsum(freq, dtype=np.float64, out=cum)
+            block_advance = float(cum[-1])
+            cum -= freq
+            
+            # Generate the main tone, continuing from the phase where the
+            # previous block ended
+            np.add(cum, self.phase_main, out=phase)
+            np.sin(phase, out=main_tone)
+            self.phase_main = (self.phase_main + block_advance) % self._phase_period
             
             # Add notch filter effect based on Quality Factor
-            if self.quality_factor > 1:
-                # Calculate notch depth based on quality factor
-                q_factor = min(self.quality_factor / 100.0, 1.0)  # Normalize to 0-1
-                notch_depth = q_factor * 0.2  # Maximum 20% reduction
-                
-                # Create notch by adding out-of-phase tones at nearby frequencies
-                notch_freq1 = current_freq * 0.95  # Slightly below
-                notch_freq2 = current_freq * 1.05  # Slightly above
-                
-                notch_tone1 = notch_depth * weighted_amplitude * np.sin(2 * np.pi * notch_freq1 * t + np.pi)
-                notch_tone2 = notch_depth * weighted_amplitude * np.sin(2 * np.pi * notch_freq2 * t + np.pi)
-                
-                # Combine main tone with notch effect
-                wave = main_tone + notch_tone1 + notch_tone2
-            else:
-                wave = main_tone
-                
-            outdata[:, 0] = wave.astype(np.float32)
+            if notch_depth > 0:
+                # The notch is a pair of out-of-phase tones slightly below and
+                # above, tracking the sweep. By sin A + sin B =
+                # 2 sin((A+B)/2) cos((A-B)/2) their sum is
+                # -2 sin(phase) cos(spread * phase), so the pair becomes an
+                # envelope on the main tone instead of two more sines
+                envelope = self._buf_env[:frames]
+                np.multiply(phase, np.float32(self._NOTCH_SPREAD), out=envelope)
+                np.cos(envelope, out=envelope)
+                envelope *= np.float32(-2 * notch_depth)
+                envelope += np.float32(1)
+                main_tone *= envelope
+            main_tone *= weight
+            
+            # Every step above ran on contiguous scratch buffers; the strided
+            # output channel is only written once, here
+            np.copyto(outdata[:, 0], main_tone)
         else:
             outdata.fill(0)
 
@@ -0,0 +1,72 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+import numpy as np
+
+
+SAMPLE_RATE = 44100
+
+
+def _tone(frequency, duration, amplitude=1.0):
+    """Return a float32 sine tone sampled at SAMPLE_RATE."""
+    t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False, dtype=np.float32)
+    return amplitude * np.sin(2 * np.pi * frequency * t)
+
+
+def _channels(*channels, dtype=np.float32):
+    """Stack equal-length channels into a preallocated, contiguous (channels, samples) array."""
+    audio_data = np.empty((len(channels), len(channels[0])), dtype=dtype)
+    for row, channel in zip(audio_data, channels):
+        row[:] = channel
+    return audio_data
+
+
+def _read_only(audio_data):
+    """Mark a shared signal read-only, so a test that modifies it fails loudly."""
+    audio_data.flags.writeable = False
+    return audio_data
+
+
+@pytest.fixture(scope="session")
+def three_tone_signal():
+    """One second of 500, 1000 and 2000 Hz tones, the middle one to be notched."""
+    return _read_only(_tone(500, 1.0) + _tone(1000, 1.0) + _tone(2000, 1.0))
+
+
+@pytest.fixture(scope="session")
+def tone_1k():
+    """One second of a 1000 Hz tone."""
+    return _read_only(_tone(1000, 1.0))
+
+
+@pytest.fixture(scope="session")
+def stereo_tone_1k():
+    """One second of a 1000 Hz tone, channel-first, with the right channel at half level."""
+    return _read_only(_channels(_tone(1000, 1.0), _tone(1000, 1.0, 0.5)))
+
+
+@pytest.fixture(scope="session")
+def short_tone_440():
+    """A tenth of a second of A4 (440 Hz)."""
+    return _read_only(_tone(440, 0.1))
+
+
+@pytest.fixture(scope="session")
+def short_stereo_440_880():
+    """A tenth of a second of 440 Hz on the left and 880 Hz on the right."""
+    return _read_only(_channels(_tone(440, 0.1), _tone(880, 0.1)))
+
+
+@pytest.fixture(scope="module")
+def tk_root():
+    """One hidden Tk root per test module, so the Tcl interpreter starts once."""
+    tk = pytest.importorskip("tkinter")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tkinter not available: {e}")
+    root.withdraw()
+    yield root
+    root.destroy()
@@ -4,29 +4,62 @@ Tests for the AudioProcessor class.
 
 import pytest
 import numpy as np
-import tempfile
+import functools
+import io
 import os
 from pathlib import Path
-import sys
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from src.audio_processor import AudioProcessor
 
-from audio_processor import AudioProcessor
+
+@functools.lru_cache(maxsize=None)
+def _test_wav_bytes():
+    """Encode the test WAV file once; every test file is a copy of these bytes."""
+    import soundfile as sf
+    
+    sample_rate = 44100
+    duration = 0.1
+    t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=np.float32)
+    # A4 note, quantized to the file's 16-bit PCM up front
+    audio_data = (np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+    
+    wav_buffer = io.BytesIO()
+    sf.write(wav_buffer, audio_data, sample_rate, format='WAV', subtype='PCM_16')
+    return wav_buffer.getvalue()
+
+
+def _assert_filtered(filtered_signal, signal_data):
+    """Assert the filter returned a new, changed signal.
+    
+    A separate buffer whose first 512 samples differ is enough to show the
+    filter ran, without comparing every sample of the signal.
+    """
+    assert not np.shares_memory(filtered_signal, signal_data)
+    assert np.linalg.norm(filtered_signal[..., :512] - signal_data[..., :512]) > 1e-6
+
+
+def _notch_attenuation_db(filtered_signal, signal_data, sample_rate, frequency):
+    """Return how far the filter lowered frequency in each channel, in dB.
+    
+    Both signals go through one real FFT along the sample axis, padded to a
+    length pocketfft handles quickly.
+    """
+    from scipy.fft import rfft, next_fast_len
+    
+    n = next_fast_len(signal_data.shape[-1], real=True)
+    spectra = np.abs(rfft(np.stack([filtered_signal, signal_data]), n=n, axis=-1, workers=-1))
+    index = round(frequency * n / sample_rate)
+    return 20 * np.log10(spectra[0, ..., index] / spectra[1, ..., index])
 
 
 class TestAudioProcessor:
     """Test cases for AudioProcessor class."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
         self.processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0)
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = str(tmp_path)
     
     def test_init(self):
         """Test AudioProcessor initialization."""
@@ -48,47 +81,49 @@ class TestAudioProcessor:
         expected_formats = {'.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a'}
         assert AudioProcessor.SUPPORTED_FORMATS == expected_formats
     
-    def test_apply_notch_filter_mono(self):
+    def test_demo_extensions_match_supported_formats(self):
+        """Test the demo scripts' extension set mirrors the processor's."""
+        from demo_files.demo_utils import AUDIO_EXTENSIONS
+        assert AUDIO_EXTENSIONS == AudioProcessor.SUPPORTED_FORMATS
+    
+    def test_apply_notch_filter_mono(self, three_tone_signal):
         """Test notch filter application on mono audio."""
-        # Create test audio signal
+        # Signal with 500, 1000 (to be notched) and 2000 Hz components
         sample_rate = 44100
-        duration = 1.0  # seconds
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        # Create signal with multiple frequencies
-        signal_data = (np.sin(2 * np.pi * 500 * t) +  # 500 Hz
-                      np.sin(2 * np.pi * 1000 * t) +  # 1000 Hz (to be notched)
-                      np.sin(2 * np.pi * 2000 * t))   # 2000 Hz
+        signal_data = three_tone_signal
         
         # Apply notch filter
         filtered_signal = self.processor.apply_notch_filter(signal_data, sample_rate)
         
-        # Check that signal was filtered
+        # Check that signal was filtered in its own precision
         assert filtered_signal.shape == signal_data.shape
-        assert not np.array_equal(filtered_signal, signal_data)
+        assert filtered_signal.dtype == np.float32
+        _assert_filtered(filtered_signal, signal_data)
         
-        # Check that the notch frequency component is reduced
-        # This is a basic check - in practice, you'd use FFT to verify frequency content
+        # Check that the notch frequency component is reduced and the others kept
         assert np.max(np.abs(filtered_signal)) < np.max(np.abs(signal_data))
+        assert _notch_attenuation_db(filtered_signal, signal_data, sample_rate, 1000) < -20
+        assert _notch_attenuation_db(filtered_signal, signal_data, sample_rate, 500) > -1
+        assert _notch_attenuation_db(filtered_signal, signal_data, sample_rate, 2000) > -1
     
-    def test_apply_notch_filter_stereo(self):
+    def test_apply_notch_filter_stereo(self, stereo_tone_1k):
         """Test notch filter application on stereo audio."""
-        # Create test stereo audio signal
         sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        # Create stereo signal
-        left_channel = np.sin(2 * np.pi * 1000 * t)
-        right_channel = np.sin(2 * np.pi * 1000 * t) * 0.5
-        signal_data = np.array([left_channel, right_channel])
+        signal_data = stereo_tone_1k
         
         # Apply notch filter
         filtered_signal = self.processor.apply_notch_filter(signal_data, sample_rate)
         
         # Check that signal was filtered
         assert filtered_signal.shape == signal_data.shape
-        assert not np.array_equal(filtered_signal, signal_data)
+        assert filtered_signal.dtype == np.float32
+        assert filtered_signal.flags['C_CONTIGUOUS']
+        _assert_filtered(filtered_signal, signal_data)
+        assert np.all(_notch_attenuation_db(filtered_signal, signal_data, sample_rate, 1000) < -20)
+        
+        # Both channels are filtered in one call, matching each filtered alone
+        left_signal = self.processor.apply_notch_filter(signal_data[0], sample_rate)
+        np.testing.assert_allclose(filtered_signal[0], left_signal, atol=1e-6)
     
     def test_apply_notch_filter_invalid_frequency(self):
         """Test notch filter with invalid frequency."""
@@ -102,34 +137,170 @@ class TestAudioProcessor:
         filtered_signal = self.processor.apply_notch_filter(signal_data, sample_rate)
         assert np.array_equal(filtered_signal, signal_data)
     
-    def test_apply_notch_filter_with_frequency_range(self):
+    def test_apply_notch_filter_with_frequency_range(self, tone_1k):
         """Test notch filter with frequency range instead of quality factor."""
         # Create processor with frequency range
         processor = AudioProcessor(notch_frequency=1000.0, frequency_range=50.0)
         
-        # Create test audio signal
         sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        signal_data = np.sin(2 * np.pi * 1000 * t)  # 1000 Hz tone
+        signal_data = tone_1k  # 1000 Hz tone
         
         # Apply notch filter
         filtered_signal = processor.apply_notch_filter(signal_data, sample_rate)
         
         # Check that signal was filtered
         assert filtered_signal.shape == signal_data.shape
-        assert not np.array_equal(filtered_signal, signal_data)
+        _assert_filtered(filtered_signal, signal_data)
         
         # Check that the notch frequency component is reduced
         assert np.max(np.abs(filtered_signal)) < np.max(np.abs(signal_data))
+        assert _notch_attenuation_db(filtered_signal, signal_data, sample_rate, 1000) < -20
+    
+    def test_apply_cascade_notch_mains(self):
+        """Test notching mains hum and its harmonics in one cascaded filter."""
+        sample_rate = 44100
+        t = np.arange(2 * sample_rate, dtype=np.float32) / sample_rate
+        signal_data = sum(np.sin(2 * np.pi * f * t) for f in (50, 100, 150, 440))
+        
+        filtered_signal = self.processor.apply_cascade_notch(signal_data, sample_rate, [50, 100, 150])
+        assert filtered_signal.shape == signal_data.shape
+        assert filtered_signal.dtype == np.float32
+        
+        # Compare one second from the middle, clear of the edge transients
+        steady = slice(sample_rate // 2, sample_rate // 2 + sample_rate)
+        for harmonic in (50, 100, 150):
+            assert _notch_attenuation_db(filtered_signal[steady], signal_data[steady],
+                                         sample_rate, harmonic) < -20
+        assert _notch_attenuation_db(filtered_signal[steady], signal_data[steady],
+                                     sample_rate, 440) > -1
+    
+    def test_apply_notch_filter_single_pass(self):
+        """Test the forward-only filter when zero phase is not required."""
+        processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0, zero_phase=False)
+        
+        sample_rate = 44100
+        t = np.arange(sample_rate, dtype=np.float32) / sample_rate
+        signal_data = np.empty((2, sample_rate), dtype=np.float32)
+        signal_data[0] = np.sin(2 * np.pi * 1000 * t)
+        signal_data[1] = np.sin(2 * np.pi * 500 * t)
+        
+        filtered_signal = processor.apply_notch_filter(signal_data, sample_rate)
+        assert filtered_signal.shape == signal_data.shape
+        assert filtered_signal.dtype == np.float32
+        
+        # The 1000 Hz channel is notched out once the filter settles
+        assert np.max(np.abs(filtered_signal[0, sample_rate // 2:])) < 0.1
+        assert np.max(np.abs(filtered_signal[1, sample_rate // 2:])) > 0.9
+    
+    def test_streaming_matches_single_pass(self, three_tone_signal):
+        """Test that filtering block by block matches one forward pass and notches the tone."""
+        processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0, zero_phase=False)
+        sample_rate = 44100
+        signal_data = three_tone_signal
+        
+        blocks = []
+        state = None
+        for start in range(0, len(signal_data), 4096):
+            block, state = processor.apply_notch_filter_streaming(signal_data[start:start + 4096],
+                                                                  sample_rate, state)
+            blocks.append(block)
+        streamed = np.concatenate(blocks)
+        
+        np.testing.assert_allclose(streamed, processor.apply_notch_filter(signal_data, sample_rate),
+                                   rtol=0, atol=1e-12)
+        
+        # Once past the start-up transient the tone is notched and its neighbours kept
+        steady = slice(sample_rate // 4, None)
+        assert _notch_attenuation_db(streamed[steady], signal_data[steady], sample_rate, 1000) < -20
+        assert _notch_attenuation_db(streamed[steady], signal_data[steady], sample_rate, 500) > -1
+    
+    @pytest.mark.parametrize("blocksize", [4096, 65536])
+    def test_stream_filter_matches_full_read(self, blocksize):
+        """Test that filtering a file block by block matches filtering it whole."""
+        import soundfile as sf
+        
+        processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0, zero_phase=False)
+        audio_path = os.path.join(self.temp_dir, "test.wav")
+        self._create_test_wav_file(audio_path)
+        
+        streamed = io.BytesIO()
+        processor._stream_filter(audio_path, streamed, output_format='WAV', blocksize=blocksize)
+        
+        audio_data, sample_rate = processor.load_audio(audio_path)
+        expected = io.BytesIO()
+        sf.write(expected, processor.apply_notch_filter(audio_data, sample_rate), sample_rate,
+                 format='WAV')
+        assert streamed.getvalue() == expected.getvalue()
+    
+    def test_process_file_streaming(self):
+        """Test that the forward-only filter streams the file to an MP3."""
+        processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0, zero_phase=False)
+        audio_path = os.path.join(self.temp_dir, "test.wav")
+        self._create_test_wav_file(audio_path)
+        
+        output_path = os.path.join(self.temp_dir, "output.wav")
+        assert processor.process_file(audio_path, output_path, "Test Artist") is True
+        assert os.path.getsize(os.path.join(self.temp_dir, "output.mp3")) > 0
+    
+    def test_load_audio_channel_first_contiguous(self):
+        """Test that stereo audio is loaded as contiguous (channels, samples)."""
+        import soundfile as sf
+        
+        audio_path = os.path.join(self.temp_dir, "stereo.wav")
+        sf.write(audio_path, np.zeros((4410, 2)), 44100)
+        
+        audio_data, sample_rate = self.processor.load_audio(audio_path)
+        assert audio_data.shape == (2, 4410)
+        assert audio_data.flags['C_CONTIGUOUS']
+    
+    def test_apply_notch_filter_preserves_float32(self):
+        """Test that float32 audio is not upcast by the filter."""
+        sample_rate = 44100
+        signal_data = np.random.randn(2, 4096).astype(np.float32)
+        
+        filtered_signal = self.processor.apply_notch_filter(signal_data, sample_rate)
+        assert filtered_signal.dtype == np.float32
+        assert filtered_signal.shape == signal_data.shape
+    
+    def test_filter_coefficients_cached(self):
+        """Test that filter coefficients are designed once per configuration."""
+        sample_rate = 44100
+        signal_data = np.random.randn(4096)
+        
+        self.processor.apply_notch_filter(signal_data, sample_rate)
+        sos, zi = self.processor._get_notch_coefficients(sample_rate, 30.0)
+        self.processor.apply_notch_filter(signal_data, sample_rate)
+        assert self.processor._get_notch_coefficients(sample_rate, 30.0)[0] is sos
+        
+        # A different sample rate or notch frequency needs its own design
+        assert self.processor._get_notch_coefficients(48000, 30.0)[0] is not sos
+        self.processor.notch_frequency = 2000.0
+        self.processor.apply_notch_filter(signal_data, sample_rate)
+        assert self.processor._get_notch_coefficients(sample_rate, 30.0)[0] is not sos
+    
+    def test_cached_filter_coefficients_read_only(self):
+        """Test that shared filter designs cannot be modified in place."""
+        designs = [self.processor._get_notch_coefficients(44100, 30.0),
+                   self.processor._get_cascade_coefficients(44100, (50.0, 100.0), (30.0, 30.0))]
+        for sos, zi in designs:
+            with pytest.raises(ValueError):
+                sos[0, 0] = 0.0
+            with pytest.raises(ValueError):
+                zi[0, 0] = 0.0
     
-    def test_save_audio_wav(self):
+    def test_filter_coefficients_shared_between_processors(self):
+        """Test that processors with the same settings reuse one filter design."""
+        other = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0)
+        
+        sos, zi = self.processor._get_notch_coefficients(44100, 30.0)
+        other_sos, other_zi = other._get_notch_coefficients(44100, 30.0)
+        assert other_sos is sos
+        assert other_zi is zi
+    
+    def test_save_audio_wav(self, short_tone_440):
         """Test saving audio to WAV format."""
-        # Create test audio data
         sample_rate = 44100
-        duration = 0.1  # Short duration for testing
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        audio_data = np.sin(2 * np.pi * 440 * t)  # A4 note
+        audio_data = short_tone_440  # A4 note
         
         output_path = os.path.join(self.temp_dir, "test_output.wav")
         
@@ -143,16 +314,10 @@ class TestAudioProcessor:
         file_size = os.path.getsize(output_path)
         assert file_size > 0
     
-    def test_save_audio_stereo(self):
+    def test_save_audio_stereo(self, short_stereo_440_880):
         """Test saving stereo audio."""
         sample_rate = 44100
-        duration = 0.1
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        # Create stereo audio
-        left_channel = np.sin(2 * np.pi * 440 * t)
-        right_channel = np.sin(2 * np.pi * 880 * t)
-        audio_data = np.array([left_channel, right_channel])
+        audio_data = short_stereo_440_880
         
         output_path = os.path.join(self.temp_dir, "test_stereo.wav")
         
@@ -170,6 +335,22 @@ class TestAudioProcessor:
         # Should not raise exception
         self.processor.copy_metadata(source_path, target_path)
     
+    def test_copy_metadata_mp3(self):
+        """Test metadata copying onto an existing MP3 file."""
+        from mutagen.id3 import ID3
+        
+        source_path = os.path.join(self.temp_dir, "source.wav")
+        self._create_test_wav_file(source_path)
+        
+        target_path = os.path.join(self.temp_dir, "target.wav")
+        audio_data, sample_rate = self.processor.load_audio(source_path)
+        self.processor.save_audio(audio_data, sample_rate, target_path)
+        
+        self.processor.copy_metadata(source_path, target_path, new_artist="Test Artist")
+        
+        tags = ID3(os.path.join(self.temp_dir, "target.mp3"))
+        assert tags['TPE1'].text == ["Test Artist"]
+    
     def test_process_file_nonexistent(self):
         """Test processing non-existent file."""
         input_path = "nonexistent_input.wav"
@@ -230,29 +411,140 @@ class TestAudioProcessor:
             output_file = os.path.join(output_dir, f"test_{i}.wav")
             assert os.path.exists(output_file)
     
-    def _create_test_wav_file(self, file_path):
-        """Create a simple test WAV file."""
-        import soundfile as sf
+    def test_process_directory_parallel(self):
+        """Test processing a batch of files in a pool of worker processes."""
+        input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(input_dir)
+        for i in range(4):
+            self._create_test_wav_file(os.path.join(input_dir, f"test_{i}.wav"))
         
-        sample_rate = 44100
-        duration = 0.1
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        audio_data = np.sin(2 * np.pi * 440 * t)  # A4 note
+        output_dir = os.path.join(self.temp_dir, "output")
+        
+        result = self.processor.process_directory(input_dir, output_dir, max_workers=2)
+        
+        assert sorted(result) == sorted(
+            os.path.join(input_dir, f"test_{i}.wav") for i in range(4))
+        for i in range(4):
+            assert os.path.exists(os.path.join(output_dir, f"test_{i}.mp3"))
+    
+    def test_process_directory_parallel_logs_worker_errors(self):
+        """Test that failures logged inside worker processes reach the package logger."""
+        import logging
+        
+        class RecordingHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.records = []
+            
+            def emit(self, record):
+                self.records.append(record)
+        
+        input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(input_dir)
+        self._create_test_wav_file(os.path.join(input_dir, "test_0.wav"))
+        with open(os.path.join(input_dir, "broken.wav"), "w") as f:
+            f.write("not audio")
+        
+        output_dir = os.path.join(self.temp_dir, "output")
+        
+        # The GUI attaches its log pane handler to the "src" package logger
+        package_logger = logging.getLogger("src")
+        handler = RecordingHandler()
+        package_logger.addHandler(handler)
+        try:
+            result = self.processor.process_directory(input_dir, output_dir, max_workers=2)
+        finally:
+            package_logger.removeHandler(handler)
+        
+        assert result == [os.path.join(input_dir, "test_0.wav")]
+        errors = [record for record in handler.records
+                  if record.levelno == logging.ERROR and record.process != os.getpid()]
+        assert any("broken.wav" in record.getMessage() for record in errors)
+    
+    def test_process_directory_single_worker(self):
+        """Test the pipelined single-worker path, skipping unreadable files."""
+        input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(os.path.join(input_dir, "album"))
+        
+        for i in range(3):
+            self._create_test_wav_file(os.path.join(input_dir, "album", f"test_{i}.wav"))
+        with open(os.path.join(input_dir, "broken.wav"), "w") as f:
+            f.write("not audio")
+        
+        output_dir = os.path.join(self.temp_dir, "output")
+        
+        result = self.processor.process_directory(input_dir, output_dir, max_workers=1)
+        
+        assert len(result) == 3
+        for i in range(3):
+            assert os.path.exists(os.path.join(output_dir, "album", f"test_{i}.mp3"))
+    
+    def test_process_files_reports_progress(self):
+        """Test listing files and reporting progress as each one finishes."""
+        input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(input_dir)
+        for i in range(2):
+            self._create_test_wav_file(os.path.join(input_dir, f"test_{i}.wav"))
+        
+        output_dir = os.path.join(self.temp_dir, "output")
+        jobs = self.processor.list_files(input_dir, output_dir)
+        assert sorted(output for _, output in jobs) == [
+            os.path.join(output_dir, "test_0.wav"), os.path.join(output_dir, "test_1.wav")]
+        
+        progress = []
+        result = self.processor.process_files(jobs, max_workers=1,
+                                              progress_callback=lambda *args: progress.append(args))
+        assert len(result) == 2
+        assert progress == [(1, 2), (2, 2)]
+    
+    def test_process_files_cancelled(self):
+        """Test that a set cancel event skips files that have not started."""
+        import threading
         
-        sf.write(file_path, audio_data, sample_rate)
+        input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(input_dir)
+        for i in range(2):
+            self._create_test_wav_file(os.path.join(input_dir, f"test_{i}.wav"))
+        
+        output_dir = os.path.join(self.temp_dir, "output")
+        jobs = self.processor.list_files(input_dir, output_dir)
+        
+        cancel_event = threading.Event()
+        cancel_event.set()
+        result = self.processor.process_files(jobs, max_workers=1, cancel_event=cancel_event)
+        assert result == []
+        assert not any(name.endswith('.mp3') for name in os.listdir(output_dir))
+    
+    def test_process_files_parallel_cancelled_midway(self):
+        """Test that cancelling a parallel run stops files from being submitted."""
+        import threading
+        
+        input_dir = os.path.join(self.temp_dir, "input")
+        os.makedirs(input_dir)
+        for i in range(12):
+            self._create_test_wav_file(os.path.join(input_dir, f"test_{i}.wav"))
+        
+        output_dir = os.path.join(self.temp_dir, "output")
+        jobs = self.processor.list_files(input_dir, output_dir)
+        
+        cancel_event = threading.Event()
+        result = self.processor.process_files(
+            jobs, max_workers=2, cancel_event=cancel_event,
+            progress_callback=lambda completed, total: cancel_event.set())
+        assert 1 <= len(result) < len(jobs)
+    
+    def _create_test_wav_file(self, file_path):
+        """Create a simple test WAV file."""
+        Path(file_path).write_bytes(_test_wav_bytes())
 
 
 class TestAudioProcessorIntegration:
     """Integration tests for AudioProcessor."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_fixtures(self, tmp_path):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir = str(tmp_path)
     
     def test_full_processing_pipeline(self):
         """Test the complete processing pipeline."""
@@ -278,16 +570,25 @@ class TestAudioProcessorIntegration:
         file_size = os.path.getsize(output_path)
         assert file_size > 0
     
-    def _create_test_wav_file(self, file_path):
-        """Create a simple test WAV file."""
-        import soundfile as sf
+    def test_process_file_writes_tags(self):
+        """Test that the output MP3 carries the new artist and album tags."""
+        from mutagen.id3 import ID3
         
-        sample_rate = 44100
-        duration = 0.1
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        audio_data = np.sin(2 * np.pi * 440 * t)  # A4 note
+        processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0)
         
-        sf.write(file_path, audio_data, sample_rate)
+        audio_path = os.path.join(self.temp_dir, "test.wav")
+        self._create_test_wav_file(audio_path)
+        
+        output_path = os.path.join(self.temp_dir, "output.wav")
+        assert processor.process_file(audio_path, output_path, "Test Artist", "Test Album")
+        
+        tags = ID3(os.path.join(self.temp_dir, "output.mp3"))
+        assert tags['TPE1'].text == ["Test Artist"]
+        assert tags['TALB'].text == ["Test Album"]
+    
+    def _create_test_wav_file(self, file_path):
+        """Create a simple test WAV file."""
+        Path(file_path).write_bytes(_test_wav_bytes())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+"""
+Throughput benchmarks for the notch filter.
+
+These run only when pytest-benchmark is installed; deselect them with
+-m "not slow", or compare runs with --benchmark-autosave and
+--benchmark-compare.
+"""
+
+import pytest
+import numpy as np
+
+pytest.importorskip("pytest_benchmark")
+
+from src.audio_processor import AudioProcessor
+
+
+SAMPLE_RATE = 44100
+
+
+@pytest.fixture(scope="module")
+def stereo_noise_10s():
+    """Ten seconds of stereo float32 noise, channel-first."""
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((2, 10 * SAMPLE_RATE), dtype=np.float32)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("zero_phase", [True, False])
+def test_bench_notch(benchmark, stereo_noise_10s, zero_phase):
+    """Benchmark apply_notch_filter on ten seconds of stereo audio."""
+    processor = AudioProcessor(notch_frequency=1000.0, quality_factor=30.0, zero_phase=zero_phase)
+    
+    filtered = benchmark(processor.apply_notch_filter, stereo_noise_10s, SAMPLE_RATE)
+    assert filtered.shape == stereo_noise_10s.shape
+    
+    benchmark.extra_info["samples_per_second"] = stereo_noise_10s.size / benchmark.stats["mean"]
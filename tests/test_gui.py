@@ -4,37 +4,25 @@ Tests for the GUI module.
 
 import pytest
 import tkinter as tk
-import sys
-from pathlib import Path
-import tempfile
+import logging
 import os
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from gui import NotchedMusicGUI
+from src.gui import NotchedMusicGUI
 
 
 class TestNotchedMusicGUI:
     """Test cases for NotchedMusicGUI class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        try:
-            self.root = tk.Tk()
-            self.root.withdraw()  # Hide the window during tests
-            self.gui = NotchedMusicGUI(self.root)
-            self.temp_dir = tempfile.mkdtemp()
-        except tk.TclError as e:
-            pytest.skip(f"Tkinter not available: {e}")
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if hasattr(self, 'root') and self.root:
-            self.root.destroy()
-        if hasattr(self, 'temp_dir'):
-            import shutil
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def gui_window(self, tk_root, tmp_path):
+        """Set up each GUI in its own window of the shared Tk root."""
+        self.root = tk.Toplevel(tk_root)
+        self.root.withdraw()  # Hide the window during tests
+        self.gui = NotchedMusicGUI(self.root)
+        self.temp_dir = str(tmp_path)
+        yield
+        # Closing cancels the GUI's polling loops and detaches its log handler
+        self.gui._on_close()
     
     def test_gui_initialization(self):
         """Test GUI initialization."""
@@ -175,15 +163,6 @@ class TestNotchedMusicGUI:
 class TestGUIIntegration:
     """Integration tests for GUI components."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_gui_creation_and_destruction(self):
         """Test GUI creation and destruction."""
         try:
@@ -199,6 +178,21 @@ class TestGUIIntegration:
         except tk.TclError as e:
             pytest.skip(f"Tkinter not available: {e}")
     
+    def test_close_stops_polling_and_detaches_log_handler(self, tk_root):
+        """Test that closing a window leaves nothing running on a shared Tk root."""
+        window = tk.Toplevel(tk_root)
+        window.withdraw()
+        gui = NotchedMusicGUI(window)
+        package_logger = logging.getLogger("src")
+        assert gui._log_handler in package_logger.handlers
+        
+        scheduled = (gui._ui_poll_id, gui._log_handler.flush_id)
+        gui._on_close()
+        
+        assert gui._log_handler not in package_logger.handlers
+        pending = tk_root.tk.splitlist(tk_root.tk.call('after', 'info'))
+        assert not set(scheduled) & set(pending)
+    
     def test_gui_widgets_exist(self):
         """Test that all expected widgets exist."""
         try:
@@ -208,18 +202,11 @@ class TestGUIIntegration:
             try:
                 gui = NotchedMusicGUI(root)
                 
-                # Check that key widgets exist
-                assert hasattr(gui, 'input_dir')
-                assert hasattr(gui, 'output_dir')
-                assert hasattr(gui, 'notch_frequency')
-                assert hasattr(gui, 'quality_factor')
-                assert hasattr(gui, 'new_artist')
-                assert hasattr(gui, 'new_album')
-                assert hasattr(gui, 'advanced_mode')
-                assert hasattr(gui, 'process_button')
-                assert hasattr(gui, 'progress_bar')
-                assert hasattr(gui, 'status_label')
-                assert hasattr(gui, 'log_text')
+                # Check that key widgets exist, reporting every missing one
+                expected = {'input_dir', 'output_dir', 'notch_frequency', 'quality_factor',
+                            'new_artist', 'new_album', 'advanced_mode', 'process_button',
+                            'progress_bar', 'status_label', 'log_text'}
+                assert expected <= vars(gui).keys()
                 
             finally:
                 root.destroy()
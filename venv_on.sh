@@ -48,7 +48,7 @@ echo "✅ Notched Music environment ready!"
 echo "========================================"
 echo ""
 echo "Available commands:"
-echo "  python src/main.py          - Run the GUI application"
+echo "  python -m src          - Run the GUI application"
 echo "  python run_tests.py         - Run test suite"
 echo "  python run_demo.py          - Run interactive demo"
 echo "  python install_dependencies.py - Install/update dependencies"